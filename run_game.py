@@ -1,12 +1,6 @@
 #!/usr/bin/env python3
 """Entry point for running the Minesweeper game."""
 
-import sys
-import os
-
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 from src.main import main
 
 if __name__ == "__main__":
@@ -34,6 +34,10 @@ COLOR_NUMBER_8 = (128, 128, 128)      # Gray
 DOUBLE_CLICK_TIME = 300  # milliseconds
 FPS_TARGET = 60
 FPS_MIN = 30
+STATUS_REFRESH_MS = 250  # status bar refresh interval while idle
+
+# Rendering
+MAX_DIRTY_RECTS = 25  # above this, update one bounding rect instead
 
 # Board constraints
 MIN_BOARD_WIDTH = 9
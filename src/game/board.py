@@ -1,13 +1,32 @@
 """Board entity for minesweeper game with grid management and mine generation."""
 
 import random
-from typing import List, Set, Tuple, Optional
-from .cell import Cell
-from .validator import validate_position, get_adjacent_positions
+from collections import deque
+from typing import Dict, List, Set, Tuple, Optional
+from .cell import BoardCell, CellBase
+from .validator import validate_position, build_neighbor_cache
 
 
 class Board:
-    """Represents the minesweeper game board."""
+    """Represents the minesweeper game board.
+
+    Cell state is stored as parallel flat arrays (struct-of-arrays), one
+    byte per cell, indexed by ``row * width + col``:
+
+    - ``is_mine``: 1 if the cell contains a mine
+    - ``is_revealed``: 1 if the cell has been revealed
+    - ``is_flagged``: 1 if the cell is flagged
+    - ``adjacent``: number of adjacent mines (0-8)
+
+    ``cells`` exposes a grid of ``BoardCell`` views over these arrays for
+    callers that want per-cell objects.
+    """
+
+    __slots__ = (
+        'width', 'height', 'mine_count', 'revealed_count', 'flagged_count',
+        'first_click', '_mine_revealed', '_non_mine_total',
+        'is_mine', 'is_revealed', 'is_flagged', 'adjacent', '_neighbors', '_cells',
+    )
 
     def __init__(self, width: int, height: int, mine_count: int):
         """Initialize a new board with given dimensions and mine count.
@@ -20,78 +39,133 @@ class Board:
         self.width = width
         self.height = height
         self.mine_count = mine_count
-        self.cells: List[List[Cell]] = []
         self.revealed_count = 0
         self.flagged_count = 0
         self.first_click = True
-        self.mine_positions: Set[Tuple[int, int]] = set()
+        self._mine_revealed = False
+        self._non_mine_total = width * height - mine_count
 
         # Initialize empty grid
         self._initialize_grid()
 
     def _initialize_grid(self) -> None:
         """Initialize the grid with empty cells."""
-        self.cells = []
-        for row in range(self.height):
-            row_cells = []
-            for col in range(self.width):
-                row_cells.append(Cell(row, col))
-            self.cells.append(row_cells)
+        size = self.width * self.height
+        self.is_mine = bytearray(size)
+        self.is_revealed = bytearray(size)
+        self.is_flagged = bytearray(size)
+        self.adjacent = bytearray(size)
+        self._neighbors = build_neighbor_cache(self.width, self.height)
+        self._cells: Optional[List[List[CellBase]]] = None
+
+    @property
+    def cells(self) -> List[List[CellBase]]:
+        """Grid of cell views, built on first access."""
+        if self._cells is None:
+            self._cells = [
+                [BoardCell(self, row, col) for col in range(self.width)]
+                for row in range(self.height)
+            ]
+        return self._cells
+
+    @property
+    def mine_positions(self) -> Set[Tuple[int, int]]:
+        """Set of (row, col) positions holding a mine.
+
+        Built from ``is_mine`` on each access; hot paths read ``is_mine``
+        directly instead. Assigning a set replaces the mine layout and
+        recomputes ``adjacent``.
+        """
+        is_mine = self.is_mine
+        width = self.width
+        positions = set()
+        index = is_mine.find(1)
+        while index != -1:
+            positions.add(divmod(index, width))
+            index = is_mine.find(1, index + 1)
+        return positions
+
+    @mine_positions.setter
+    def mine_positions(self, positions: Set[Tuple[int, int]]) -> None:
+        # Replaces the mine layout and recomputes the adjacent counts to match
+        is_mine = bytearray(self.width * self.height)
+        for row, col in positions:
+            is_mine[row * self.width + col] = 1
+        self.is_mine = is_mine
+        self._calculate_adjacent_mines()
 
     def generate_mines(self, safe_row: int, safe_col: int) -> None:
-        """Generate mines, ensuring the safe position is not a mine.
+        """Generate mines, keeping the safe position and its neighbors clear.
+
+        The first click is guaranteed to open a region: the clicked cell and
+        its neighbors are kept mine-free. If the board is too dense for that,
+        only the clicked cell itself is kept clear.
 
         Args:
             safe_row: Row position that must not be a mine (first click)
             safe_col: Column position that must not be a mine (first click)
         """
         # Only generate mines if not already generated
-        if self.mine_positions:
+        if 1 in self.is_mine:
             return
 
-        # Get all possible positions except the safe one
-        all_positions = []
-        for row in range(self.height):
-            for col in range(self.width):
-                if (row, col) != (safe_row, safe_col):
-                    all_positions.append((row, col))
-
-        # Randomly select mine positions
-        self.mine_positions = set(random.sample(all_positions, self.mine_count))
-
-        # Place mines
-        for row, col in self.mine_positions:
-            self.cells[row][col].set_mine()
-
-        # Calculate adjacent mine counts
-        self._calculate_adjacent_mines()
+        size = self.width * self.height
+        safe_index = safe_row * self.width + safe_col
+        safe_zone = sorted((safe_index,) + self._neighbors[safe_index])
+        if size - len(safe_zone) < self.mine_count:
+            safe_zone = [safe_index]
+
+        # Sample flat indices from a range with the safe cells removed, then
+        # shift each sample past the safe cells at or below it
+        mine_indices = []
+        for index in random.sample(range(size - len(safe_zone)), self.mine_count):
+            for safe in safe_zone:
+                if index >= safe:
+                    index += 1
+            mine_indices.append(index)
+
+        # Place mines and count them into their neighbours in the same pass
+        is_mine = self.is_mine
+        neighbors = self._neighbors
+        adjacent = bytearray(size)
+        for index in mine_indices:
+            is_mine[index] = 1
+            for adj_index in neighbors[index]:
+                adjacent[adj_index] += 1
+
+        # Mine cells keep a count of 0
+        for index in mine_indices:
+            adjacent[index] = 0
+
+        self.adjacent = adjacent
 
     def _calculate_adjacent_mines(self) -> None:
-        """Calculate the number of adjacent mines for each cell."""
-        for row in range(self.height):
-            for col in range(self.width):
-                if not self.cells[row][col].is_mine:
-                    adjacent_mines = self._count_adjacent_mines(row, col)
-                    self.cells[row][col].set_adjacent_mines(adjacent_mines)
+        """Calculate the number of adjacent mines for each cell.
 
-    def _count_adjacent_mines(self, row: int, col: int) -> int:
-        """Count mines in adjacent cells.
+        ``generate_mines`` counts as it places mines; this recomputes the
+        counts for a mine layout set up by other means. Each mine adds one
+        to the count of its neighbours, so the work scales with the number
+        of mines rather than the number of cells. Mine cells themselves
+        keep a count of 0.
+        """
+        is_mine = self.is_mine
+        neighbors = self._neighbors
+        adjacent = bytearray(len(is_mine))
 
-        Args:
-            row: Row position
-            col: Column position
+        mine_indices = []
+        index = is_mine.find(1)
+        while index != -1:
+            mine_indices.append(index)
+            index = is_mine.find(1, index + 1)
 
-        Returns:
-            Number of adjacent mines (0-8)
-        """
-        count = 0
-        adjacent_positions = get_adjacent_positions(row, col, self.width, self.height)
+        for index in mine_indices:
+            for adj_index in neighbors[index]:
+                adjacent[adj_index] += 1
 
-        for adj_row, adj_col in adjacent_positions:
-            if self.cells[adj_row][adj_col].is_mine:
-                count += 1
+        for index in mine_indices:
+            adjacent[index] = 0
 
-        return count
+        self.adjacent = adjacent
 
     def reveal_cell(self, row: int, col: int) -> bool:
         """Reveal a cell at the given position.
@@ -107,62 +181,107 @@ class Board:
             ValueError: If position is out of bounds
         """
         validate_position(row, col, self.width, self.height)
+        index = row * self.width + col
 
-        cell = self.cells[row][col]
+        # First click - generate mines. Later reveals, including those made
+        # by expand_adjacent_cells, go straight to the unchecked path.
+        if self.first_click:
+            return self._first_reveal(index)
+        return self._reveal_cell_unchecked(index)
 
-        # Cannot reveal flagged or already revealed cells
-        if not cell.can_reveal():
+    def _first_reveal(self, index: int) -> bool:
+        """Generate mines around the first revealed cell, then reveal it.
+
+        Args:
+            index: Flat index of a cell known to be on the board
+
+        Returns:
+            True if cell was revealed, False if it was already revealed or flagged
+        """
+        if self.is_revealed[index] or self.is_flagged[index]:
             return False
 
-        # First click - generate mines
-        if self.first_click:
-            self.generate_mines(row, col)
-            self.first_click = False
+        self.generate_mines(*divmod(index, self.width))
+        self.first_click = False
+        return self._reveal_cell_unchecked(index)
 
-        # Reveal the cell
-        cell.reveal()
-        self.revealed_count += 1
+    def _reveal_cell_unchecked(self, index: int) -> bool:
+        """Reveal a cell by flat index without validating the position.
 
-        # If this is an empty cell (no adjacent mines), reveal adjacent cells
-        if cell.adjacent_mines == 0 and not cell.is_mine:
-            self._reveal_adjacent_empty_cells(row, col)
+        Mines must already be placed.
+
+        Args:
+            index: Flat index of a cell known to be on the board
+
+        Returns:
+            True if cell was revealed, False if it was already revealed or flagged
+        """
+        if not self._reveal_single_unchecked(index):
+            return False
+
+        if not self.is_mine[index] and self.adjacent[index] == 0:
+            # Empty cell (no adjacent mines), reveal adjacent cells
+            self._reveal_adjacent_empty_cells(index)
 
         return True
 
-    def _reveal_adjacent_empty_cells(self, row: int, col: int) -> None:
-        """Recursively reveal adjacent empty cells.
+    def _reveal_single_unchecked(self, index: int) -> bool:
+        """Reveal one cell by flat index, without flood fill or mine generation.
+
+        Keeps ``revealed_count`` and the lose condition in sync; cell views
+        reveal through this method.
 
         Args:
-            row: Starting row position
-            col: Starting column position
+            index: Flat index of a cell known to be on the board
+
+        Returns:
+            True if cell was revealed, False if it was already revealed or flagged
         """
-        to_reveal = [(row, col)]
-        revealed = set()
+        # Cannot reveal flagged or already revealed cells
+        if self.is_revealed[index] or self.is_flagged[index]:
+            return False
+
+        self.is_revealed[index] = 1
+        self.revealed_count += 1
+        if self.is_mine[index]:
+            self._mine_revealed = True
 
-        while to_reveal:
-            current_row, current_col = to_reveal.pop()
+        return True
 
-            if (current_row, current_col) in revealed:
-                continue
+    def _reveal_adjacent_empty_cells(self, index: int) -> None:
+        """Reveal the connected region of empty cells around a revealed cell.
 
-            revealed.add((current_row, current_col))
+        Cells are marked revealed as they are queued, so ``is_revealed``
+        doubles as the visited mask and each cell is queued at most once.
+        Only cells with no adjacent mines are queued, so no neighbour the
+        fill reaches can be a mine and ``is_mine`` is never read.
 
-            # Get adjacent positions
-            adjacent_positions = get_adjacent_positions(
-                current_row, current_col, self.width, self.height
-            )
+        Args:
+            index: Flat index of the starting cell (already revealed)
+        """
+        neighbors = self._neighbors
+        is_revealed = self.is_revealed
+        is_flagged = self.is_flagged
+        adjacent = self.adjacent
+        revealed_count = 0
 
-            for adj_row, adj_col in adjacent_positions:
-                adj_cell = self.cells[adj_row][adj_col]
+        queue = deque((index,))
+        while queue:
+            current = queue.popleft()
 
+            for adj_index in neighbors[current]:
                 # Only reveal hidden cells
-                if adj_cell.is_hidden and not adj_cell.is_flagged:
-                    adj_cell.reveal()
-                    self.revealed_count += 1
+                if is_revealed[adj_index] or is_flagged[adj_index]:
+                    continue
 
-                    # If this adjacent cell is also empty, add it to the queue
-                    if adj_cell.adjacent_mines == 0 and not adj_cell.is_mine:
-                        to_reveal.append((adj_row, adj_col))
+                is_revealed[adj_index] = 1
+                revealed_count += 1
+
+                # If this adjacent cell is also empty, add it to the queue
+                if adjacent[adj_index] == 0:
+                    queue.append(adj_index)
+
+        self.revealed_count += revealed_count
 
     def flag_cell(self, row: int, col: int) -> bool:
         """Toggle flag on a cell at the given position.
@@ -178,22 +297,27 @@ class Board:
             ValueError: If position is out of bounds
         """
         validate_position(row, col, self.width, self.height)
+        return self._flag_cell_unchecked(row * self.width + col)
+
+    def _flag_cell_unchecked(self, index: int) -> bool:
+        """Toggle flag on a cell by flat index without validating the position.
 
-        cell = self.cells[row][col]
+        Keeps ``flagged_count`` in sync; cell views flag through this method.
+
+        Args:
+            index: Flat index of a cell known to be on the board
 
+        Returns:
+            True if flag was toggled, False if cell cannot be flagged
+        """
         # Cannot flag revealed cells
-        if not cell.can_flag():
+        if self.is_revealed[index]:
             return False
 
-        # Toggle flag
-        was_flagged = cell.is_flagged
-        cell.flag()
-
-        # Update flag count
-        if was_flagged and not cell.is_flagged:
-            self.flagged_count -= 1
-        elif not was_flagged and cell.is_flagged:
-            self.flagged_count += 1
+        # Toggle flag; the count moves by +1 when set and -1 when cleared
+        flagged = self.is_flagged[index] ^ 1
+        self.is_flagged[index] = flagged
+        self.flagged_count += 2 * flagged - 1
 
         return True
 
@@ -212,33 +336,31 @@ class Board:
         """
         validate_position(row, col, self.width, self.height)
 
-        cell = self.cells[row][col]
+        index = row * self.width + col
 
         # Only expand revealed cells with numbers
-        if not cell.is_revealed or cell.adjacent_mines == 0:
+        if not self.is_revealed[index] or self.adjacent[index] == 0:
             return set()
 
         # Count adjacent flags
-        adjacent_positions = get_adjacent_positions(row, col, self.width, self.height)
         flag_count = 0
         hidden_adjacent = []
 
-        for adj_row, adj_col in adjacent_positions:
-            adj_cell = self.cells[adj_row][adj_col]
-            if adj_cell.is_flagged:
+        for adj_index in self._neighbors[index]:
+            if self.is_flagged[adj_index]:
                 flag_count += 1
-            elif adj_cell.is_hidden:
-                hidden_adjacent.append((adj_row, adj_col))
+            elif not self.is_revealed[adj_index]:
+                hidden_adjacent.append(adj_index)
 
         # Only expand if correct number of flags are placed
-        if flag_count != cell.adjacent_mines:
+        if flag_count != self.adjacent[index]:
             return set()
 
         # Reveal all hidden adjacent cells
         revealed = set()
-        for adj_row, adj_col in hidden_adjacent:
-            if self.reveal_cell(adj_row, adj_col):
-                revealed.add((adj_row, adj_col))
+        for adj_index in hidden_adjacent:
+            if self._reveal_cell_unchecked(adj_index):
+                revealed.add(divmod(adj_index, self.width))
 
         return revealed
 
@@ -248,8 +370,7 @@ class Board:
         Returns:
             True if all non-mine cells are revealed
         """
-        total_non_mine_cells = (self.width * self.height) - self.mine_count
-        return self.revealed_count == total_non_mine_cells
+        return self.revealed_count == self._non_mine_total
 
     def check_lose_condition(self) -> bool:
         """Check if the game has been lost.
@@ -257,12 +378,9 @@ class Board:
         Returns:
             True if any mine has been revealed
         """
-        for row, col in self.mine_positions:
-            if self.cells[row][col].is_revealed:
-                return True
-        return False
+        return self._mine_revealed
 
-    def get_cell(self, row: int, col: int) -> Cell:
+    def get_cell(self, row: int, col: int) -> CellBase:
         """Get cell at the given position.
 
         Args:
@@ -270,37 +388,56 @@ class Board:
             col: Column position (0-indexed)
 
         Returns:
-            Cell object at the position
+            Cell view at the position
 
         Raises:
             ValueError: If position is out of bounds
         """
         validate_position(row, col, self.width, self.height)
-        return self.cells[row][col]
+        if self._cells is not None:
+            return self._cells[row][col]
+        # Avoid building the whole view grid for a single lookup
+        return BoardCell(self, row, col)
+
+    def snapshot(self) -> Dict[str, bytes]:
+        """Get an immutable copy of the per-cell arrays.
+
+        Returns:
+            Dictionary mapping 'is_mine', 'is_revealed', 'is_flagged' and
+            'adjacent' to bytes indexed by ``row * width + col``
+        """
+        return {
+            'is_mine': bytes(self.is_mine),
+            'is_revealed': bytes(self.is_revealed),
+            'is_flagged': bytes(self.is_flagged),
+            'adjacent': bytes(self.adjacent),
+        }
 
     def get_board_state(self) -> List[List[dict]]:
         """Get the current state of the board for serialization.
 
+        Prefer ``snapshot`` where per-cell dictionaries are not needed.
+
         Returns:
             2D list of cell state dictionaries
         """
-        state = []
-        for row in range(self.height):
-            row_state = []
-            for col in range(self.width):
-                cell = self.cells[row][col]
-                row_state.append({
-                    'row': row,
-                    'col': col,
-                    'is_mine': cell.is_mine,
-                    'is_revealed': cell.is_revealed,
-                    'is_flagged': cell.is_flagged,
-                    'adjacent_mines': cell.adjacent_mines,
-                    'can_reveal': cell.can_reveal(),
-                    'can_flag': cell.can_flag()
-                })
-            state.append(row_state)
-        return state
+        width = self.width
+        cells = [
+            {
+                'row': index // width,
+                'col': index % width,
+                'is_mine': bool(is_mine),
+                'is_revealed': bool(is_revealed),
+                'is_flagged': bool(is_flagged),
+                'adjacent_mines': adjacent,
+                'can_reveal': not (is_revealed or is_flagged),
+                'can_flag': not is_revealed
+            }
+            for index, (is_mine, is_revealed, is_flagged, adjacent) in enumerate(
+                zip(self.is_mine, self.is_revealed, self.is_flagged, self.adjacent)
+            )
+        ]
+        return [cells[start:start + width] for start in range(0, len(cells), width)]
 
     def __str__(self) -> str:
         """String representation of the board."""
@@ -312,16 +449,16 @@ class Board:
         for row in range(self.height):
             row_str = ""
             for col in range(self.width):
-                cell = self.cells[row][col]
-                if cell.is_flagged:
+                index = row * self.width + col
+                if self.is_flagged[index]:
                     row_str += "F"
-                elif not cell.is_revealed:
+                elif not self.is_revealed[index]:
                     row_str += "?"
-                elif cell.is_mine:
+                elif self.is_mine[index]:
                     row_str += "*"
                 else:
-                    row_str += str(cell.adjacent_mines)
+                    row_str += str(self.adjacent[index])
                 row_str += " "
             lines.append(row_str)
 
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)
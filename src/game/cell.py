@@ -7,6 +7,8 @@ from enum import Enum
 class CellState(ABC):
     """Abstract base class for cell states."""
 
+    __slots__ = ()
+
     @abstractmethod
     def reveal(self) -> 'CellState':
         """Reveal the cell and return new state."""
@@ -31,13 +33,15 @@ class CellState(ABC):
 class HiddenState(CellState):
     """Hidden cell state - default state for unrevealed cells."""
 
+    __slots__ = ()
+
     def reveal(self) -> CellState:
         """Reveal the cell."""
-        return RevealedState()
+        return _REVEALED
 
     def flag(self) -> CellState:
         """Flag the cell."""
-        return FlaggedState()
+        return _FLAGGED
 
     def can_reveal(self) -> bool:
         """Hidden cells can be revealed."""
@@ -54,6 +58,8 @@ class HiddenState(CellState):
 class RevealedState(CellState):
     """Revealed cell state - cell has been clicked and revealed."""
 
+    __slots__ = ()
+
     def reveal(self) -> CellState:
         """Already revealed - no change."""
         return self
@@ -77,13 +83,15 @@ class RevealedState(CellState):
 class FlaggedState(CellState):
     """Flagged cell state - cell has been marked as potential mine."""
 
+    __slots__ = ()
+
     def reveal(self) -> CellState:
         """Cannot reveal flagged cell."""
         return self
 
     def flag(self) -> CellState:
         """Unflag the cell."""
-        return HiddenState()
+        return _HIDDEN
 
     def can_reveal(self) -> bool:
         """Flagged cells cannot be revealed."""
@@ -97,49 +105,65 @@ class FlaggedState(CellState):
         return "Flagged"
 
 
-class Cell:
-    """Represents a single cell on the minesweeper board."""
+# Shared state instances; the state classes hold no data
+_HIDDEN = HiddenState()
+_REVEALED = RevealedState()
+_FLAGGED = FlaggedState()
 
-    def __init__(self, row: int, col: int):
-        """Initialize a cell at the given position."""
-        self.row = row
-        self.col = col
-        self._state = HiddenState()
-        self.is_mine = False
-        self.adjacent_mines = 0
 
+class CellBase(ABC):
+    """Interface shared by standalone cells and board cell views.
+
+    Holds no slots of its own, so each implementation declares exactly the
+    storage it uses. Implementations provide ``row``, ``col``, ``is_mine``
+    and ``adjacent_mines`` as attributes or properties.
+    """
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def _state(self) -> CellState:
+        """Shared state instance for the cell's current state."""
+        pass
+
+    @abstractmethod
     def reveal(self) -> None:
         """Reveal the cell if possible."""
-        if self.can_reveal():
-            self._state = self._state.reveal()
+        pass
 
+    @abstractmethod
     def flag(self) -> None:
         """Toggle flag on the cell if possible."""
-        if self.can_flag():
-            self._state = self._state.flag()
+        pass
 
+    @abstractmethod
     def can_reveal(self) -> bool:
         """Check if cell can be revealed."""
-        return self._state.can_reveal()
+        pass
 
+    @abstractmethod
     def can_flag(self) -> bool:
         """Check if cell can be flagged."""
-        return self._state.can_flag()
+        pass
 
     @property
+    @abstractmethod
     def is_revealed(self) -> bool:
         """Check if cell is revealed."""
-        return isinstance(self._state, RevealedState)
+        pass
 
     @property
+    @abstractmethod
     def is_flagged(self) -> bool:
         """Check if cell is flagged."""
-        return isinstance(self._state, FlaggedState)
+        pass
 
     @property
+    @abstractmethod
     def is_hidden(self) -> bool:
         """Check if cell is hidden."""
-        return isinstance(self._state, HiddenState)
+        pass
 
     def set_mine(self) -> None:
         """Mark this cell as containing a mine."""
@@ -153,8 +177,129 @@ class Cell:
 
     def __str__(self) -> str:
         """String representation of the cell."""
-        return f"Cell({self.row}, {self.col}, {self._state}, mine={self.is_mine}, adjacent={self.adjacent_mines})"
+        return (f"Cell({self.row}, {self.col}, {self._state}, "
+                f"mine={self.is_mine}, adjacent={self.adjacent_mines})")
 
     def __repr__(self) -> str:
         """Detailed representation of the cell."""
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()
+
+
+class Cell(CellBase):
+    """Represents a single cell on the minesweeper board."""
+
+    __slots__ = ('row', 'col', '_state', 'is_mine', 'adjacent_mines')
+
+    def __init__(self, row: int, col: int):
+        """Initialize a cell at the given position."""
+        self.row = row
+        self.col = col
+        self._state: CellState = _HIDDEN
+        self.is_mine = False
+        self.adjacent_mines = 0
+
+    def reveal(self) -> None:
+        """Reveal the cell if possible."""
+        self._state = self._state.reveal()
+
+    def flag(self) -> None:
+        """Toggle flag on the cell if possible."""
+        self._state = self._state.flag()
+
+    def can_reveal(self) -> bool:
+        """Check if cell can be revealed."""
+        return self._state.can_reveal()
+
+    def can_flag(self) -> bool:
+        """Check if cell can be flagged."""
+        return self._state.can_flag()
+
+    @property
+    def is_revealed(self) -> bool:
+        """Check if cell is revealed."""
+        return self._state is _REVEALED
+
+    @property
+    def is_flagged(self) -> bool:
+        """Check if cell is flagged."""
+        return self._state is _FLAGGED
+
+    @property
+    def is_hidden(self) -> bool:
+        """Check if cell is hidden."""
+        return self._state is _HIDDEN
+
+
+class BoardCell(CellBase):
+    """Cell view backed by a board's struct-of-arrays storage.
+
+    Reads and writes go straight through to the board's flat per-cell
+    arrays, so the view carries no state of its own beyond its position.
+    """
+
+    __slots__ = ('row', 'col', '_board', '_index')
+
+    def __init__(self, board, row: int, col: int):
+        """Initialize a view onto the cell at the given board position."""
+        self.row = row
+        self.col = col
+        self._board = board
+        self._index = row * board.width + col
+
+    @property
+    def _state(self) -> CellState:
+        """Shared state object matching the underlying board arrays."""
+        if self._board.is_revealed[self._index]:
+            return _REVEALED
+        if self._board.is_flagged[self._index]:
+            return _FLAGGED
+        return _HIDDEN
+
+    @property
+    def is_mine(self) -> bool:
+        """Check if cell contains a mine."""
+        return bool(self._board.is_mine[self._index])
+
+    @is_mine.setter
+    def is_mine(self, value: bool) -> None:
+        self._board.is_mine[self._index] = 1 if value else 0
+
+    @property
+    def adjacent_mines(self) -> int:
+        """Number of adjacent mines."""
+        return self._board.adjacent[self._index]
+
+    @adjacent_mines.setter
+    def adjacent_mines(self, count: int) -> None:
+        self._board.adjacent[self._index] = count
+
+    def reveal(self) -> None:
+        """Reveal the cell if possible, updating the board's counters."""
+        self._board._reveal_single_unchecked(self._index)
+
+    def flag(self) -> None:
+        """Toggle flag on the cell if possible, updating the board's counters."""
+        self._board._flag_cell_unchecked(self._index)
+
+    def can_reveal(self) -> bool:
+        """Check if cell can be revealed."""
+        return not (self._board.is_revealed[self._index] or self._board.is_flagged[self._index])
+
+    def can_flag(self) -> bool:
+        """Check if cell can be flagged."""
+        return not self._board.is_revealed[self._index]
+
+    @property
+    def is_revealed(self) -> bool:
+        """Check if cell is revealed."""
+        return bool(self._board.is_revealed[self._index])
+
+    @property
+    def is_flagged(self) -> bool:
+        """Check if cell is flagged."""
+        return bool(self._board.is_flagged[self._index])
+
+    @property
+    def is_hidden(self) -> bool:
+        """Check if cell is hidden."""
+        return not (self._board.is_revealed[self._index] or self._board.is_flagged[self._index])
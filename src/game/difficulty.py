@@ -2,12 +2,17 @@
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+from .validator import validate_board_settings
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DifficultyLevel:
-    """Represents a difficulty level configuration."""
+    """Represents a difficulty level configuration.
+
+    Instances are immutable and hashable, so presets can be shared freely.
+    """
     name: str
     width: int
     height: int
@@ -26,29 +31,33 @@ class DifficultyPreset(Enum):
         return self.value
 
     @classmethod
-    def get_all_levels(cls) -> Dict[str, DifficultyLevel]:
-        """Get all difficulty levels as a dictionary."""
-        return {
-            preset.name.lower(): preset.level
-            for preset in cls
-        }
+    def get_all_levels(cls) -> Mapping[str, DifficultyLevel]:
+        """Get all difficulty levels as a read-only mapping."""
+        return _ALL_LEVELS
 
     @classmethod
     def get_by_name(cls, name: str) -> DifficultyLevel:
         """Get difficulty level by name."""
-        name_lower = name.lower()
-        for preset in cls:
-            if preset.name.lower() == name_lower:
-                return preset.level
-        raise ValueError(f"Unknown difficulty level: {name}")
+        try:
+            return _LEVELS_BY_NAME[name.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown difficulty level: {name}") from None
 
     @classmethod
     def validate_custom_settings(cls, width: int, height: int, mines: int) -> bool:
         """Validate custom board settings."""
-        from .validator import validate_board_settings
         return validate_board_settings(width, height, mines)
 
 
+# Preset levels keyed by lowercase preset name
+_LEVELS_BY_NAME: Dict[str, DifficultyLevel] = {
+    preset.name.lower(): preset.level for preset in DifficultyPreset
+}
+
+# Shared read-only view returned by get_all_levels
+_ALL_LEVELS: Mapping[str, DifficultyLevel] = MappingProxyType(_LEVELS_BY_NAME)
+
+
 def create_custom_difficulty(width: int, height: int, mines: int) -> DifficultyLevel:
     """Create a custom difficulty level."""
     DifficultyPreset.validate_custom_settings(width, height, mines)
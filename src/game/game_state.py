@@ -6,6 +6,7 @@ from enum import Enum
 from typing import Optional
 from .board import Board
 from .difficulty import DifficultyLevel, DifficultyPreset
+from .validator import validate_board_settings
 
 
 class GameState(Enum):
@@ -20,6 +21,11 @@ class GameState(Enum):
 class GameSession:
     """Represents a game session with state tracking."""
 
+    __slots__ = (
+        'id', 'difficulty', 'board', 'state', 'start_time', 'end_time',
+        'moves_count', 'flags_used',
+    )
+
     def __init__(self, difficulty: DifficultyLevel, session_id: Optional[str] = None):
         """Initialize a new game session.
 
@@ -201,8 +207,6 @@ def create_game_session(difficulty_name: str = "beginner", **custom_settings) ->
         ValueError: If difficulty name is invalid or custom settings are invalid
     """
     if difficulty_name.lower() == "custom":
-        from .validator import validate_board_settings
-
         width = custom_settings.get("width", 9)
         height = custom_settings.get("height", 9)
         mines = custom_settings.get("mines", 10)
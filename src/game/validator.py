@@ -1,7 +1,15 @@
 """Validation logic for minesweeper game settings."""
 
+from functools import lru_cache
 from typing import Tuple
 
+# (row, col) offsets of the 8 neighbors of a cell
+_NEIGHBOR_OFFSETS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1),
+)
+
 
 def validate_board_settings(width: int, height: int, mine_count: int) -> bool:
     """Validate board configuration parameters.
@@ -17,6 +25,14 @@ def validate_board_settings(width: int, height: int, mine_count: int) -> bool:
     Raises:
         ValueError: If any parameter is invalid
     """
+    # Fast path: one combined check for valid settings. The 25% density cap
+    # also implies mine_count < width * height.
+    if (type(width) is int and type(height) is int and type(mine_count) is int
+            and 9 <= width <= 30 and 9 <= height <= 30
+            and 1 <= mine_count and 4 * mine_count <= width * height):
+        return True
+
+    # Slow path: find the first failing rule for the error message
     # Validate dimensions
     if not isinstance(width, int) or width < 9 or width > 30:
         raise ValueError(f"Width must be between 9 and 30, got {width}")
@@ -36,9 +52,8 @@ def validate_board_settings(width: int, height: int, mine_count: int) -> bool:
         raise ValueError(f"Mine count must be less than total cells ({total_cells}), got {mine_count}")
 
     # Check mine density (max 25% for playability)
-    mine_density = mine_count / total_cells
-    if mine_density > 0.25:
-        raise ValueError(f"Mine density too high: {mine_density:.1%}, max 25%")
+    if 4 * mine_count > total_cells:
+        raise ValueError(f"Mine density too high: {mine_count / total_cells:.1%}, max 25%")
 
     return True
 
@@ -81,21 +96,40 @@ def get_adjacent_positions(row: int, col: int, width: int, height: int) -> list[
     """
     adjacent = []
 
-    # Check all 8 directions
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0:  # Skip the cell itself
-                continue
-
-            new_row, new_col = row + dr, col + dc
+    for dr, dc in _NEIGHBOR_OFFSETS:
+        new_row, new_col = row + dr, col + dc
 
-            # Check bounds
-            if 0 <= new_row < height and 0 <= new_col < width:
-                adjacent.append((new_row, new_col))
+        # Check bounds
+        if 0 <= new_row < height and 0 <= new_col < width:
+            adjacent.append((new_row, new_col))
 
     return adjacent
 
 
+@lru_cache(maxsize=32)
+def build_neighbor_cache(width: int, height: int) -> Tuple[Tuple[int, ...], ...]:
+    """Build the neighbor index table for a board of the given size.
+
+    Cells are addressed by flat index ``row * width + col``. Entry ``i`` of
+    the result holds the flat indices of all valid neighbors of cell ``i``.
+    Tables are immutable and cached per size, so every board of the same
+    dimensions shares one table.
+
+    Args:
+        width: Board width
+        height: Board height
+
+    Returns:
+        Tuple of neighbor index tuples, one per cell
+    """
+    return tuple(
+        tuple(adj_row * width + adj_col
+              for adj_row, adj_col in get_adjacent_positions(row, col, width, height))
+        for row in range(height)
+        for col in range(width)
+    )
+
+
 def calculate_mine_density(width: int, height: int, mine_count: int) -> float:
     """Calculate mine density as a percentage.
 
@@ -124,7 +158,7 @@ def suggest_reasonable_settings(width: int, height: int) -> int:
     total_cells = width * height
 
     # Use 15% density as a reasonable default
-    suggested_mines = int(total_cells * 0.15)
+    suggested_mines = total_cells * 15 // 100
 
     # Ensure at least 1 mine and reasonable limits
     suggested_mines = max(1, suggested_mines)
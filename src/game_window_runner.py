@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
-"""Direct runner for the game window to test the UI."""
+"""Direct runner for the game window to test the UI.
 
-import pygame
-import sys
-import os
+Run from the repository root with ``python -m src.game_window_runner``.
+"""
 
-# Add src to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from ui.game_window import GameWindow
+from .ui.game_window import GameWindow
 
 
 def main():
@@ -2,13 +2,9 @@
 
 import sys
 import argparse
-from ui.game_window import GameWindow
-from game.difficulty import DifficultyPreset
-
-# Add the src directory to Python path for proper imports
-import os
-import sys
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from .ui.game_window import GameWindow
+from .game.difficulty import DifficultyPreset
+from .game.validator import validate_board_settings
 
 
 def parse_arguments():
@@ -79,7 +75,6 @@ def main():
 
         if args.difficulty == 'custom':
             # Validate custom settings
-            from game.validator import validate_board_settings
             try:
                 validate_board_settings(args.width, args.height, args.mines)
                 game.start_new_game('custom', width=args.width, height=args.height, mines=args.mines)
@@ -1,20 +1,148 @@
 """Cell visual representation and rendering for minesweeper game."""
 
+import math
 import pygame
-from typing import Tuple, Optional
-from game.cell import Cell
-from config import (
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
+from ..game.cell import CellBase
+from ..config import (
     CELL_SIZE, CELL_PADDING, COLOR_HIDDEN, COLOR_REVEALED, COLOR_MINE,
     COLOR_FLAG, COLOR_TEXT, COLOR_BORDER, COLOR_NUMBER_1, COLOR_NUMBER_2,
     COLOR_NUMBER_3, COLOR_NUMBER_4, COLOR_NUMBER_5, COLOR_NUMBER_6,
     COLOR_NUMBER_7, COLOR_NUMBER_8, FONT_SIZE_MEDIUM
 )
 
+# Number colors indexed by adjacent mine count; 0 is never drawn
+_NUMBER_COLORS = (
+    COLOR_TEXT, COLOR_NUMBER_1, COLOR_NUMBER_2, COLOR_NUMBER_3, COLOR_NUMBER_4,
+    COLOR_NUMBER_5, COLOR_NUMBER_6, COLOR_NUMBER_7, COLOR_NUMBER_8,
+)
+
+# Unit direction vectors for the 8 mine spikes, every 45 degrees
+_SPIKE_DIRS = tuple(
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for angle in range(0, 360, 45)
+)
+
+
+@lru_cache(maxsize=None)
+def _spike_offsets(radius: int) -> Tuple[Tuple[int, int, int, int], ...]:
+    """Get integer (start_x, start_y, end_x, end_y) offsets of the mine spikes.
+
+    Offsets are relative to the mine center and depend only on the radius,
+    which is the same for every cell of a given size.
+    """
+    spike_length = radius // 2
+    return tuple(
+        (int(radius * 1.2 * dir_x), int(radius * 1.2 * dir_y),
+         int((radius + spike_length) * dir_x), int((radius + spike_length) * dir_y))
+        for dir_x, dir_y in _SPIKE_DIRS
+    )
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int) -> pygame.font.Font:
+    """Get the default font at the given size, loading it once.
+
+    The font module must be initialized first. Cached fonts are shared by
+    every caller; ``clear_text_caches`` drops them when pygame shuts down.
+
+    Args:
+        size: Font size in points
+
+    Returns:
+        Shared font instance
+
+    Raises:
+        pygame.error: If the font cannot be loaded
+    """
+    return pygame.font.Font(None, size)
+
+
+def to_display_format(surface: pygame.Surface, alpha: bool = False) -> pygame.Surface:
+    """Convert a surface to the display's pixel format for fast blits.
+
+    Conversion needs the display mode to be set; before that the surface
+    is returned unchanged.
+
+    Args:
+        surface: Surface to convert
+        alpha: Whether to keep per-pixel alpha
+
+    Returns:
+        Converted surface, or the original one if no display is set
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+@lru_cache(maxsize=256)
+def render_text(font: pygame.font.Font, text: str,
+                color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render anti-aliased text, reusing the surface for repeated strings.
+
+    Returned surfaces are shared between callers and must not be drawn on.
+    They are converted for the display active when first rendered, so
+    ``clear_text_caches`` drops them along with the fonts they key on.
+
+    Args:
+        font: Font to render with
+        text: Text to render
+        color: Text color
+
+    Returns:
+        Rendered text surface
+    """
+    return to_display_format(font.render(text, True, color), alpha=True)
+
+
+def clear_text_caches() -> None:
+    """Drop cached fonts and text surfaces.
+
+    Both caches hold pygame objects that are invalid once pygame is shut
+    down, so this must run before ``pygame.quit`` and before pygame is
+    initialized again.
+    """
+    render_text.cache_clear()
+    get_font.cache_clear()
+
+
+def _draw_flag_shape(screen: pygame.Surface, x: int, y: int, width: int, height: int) -> None:
+    """Draw a flag inside the cell whose top-left corner is (x, y)."""
+    # Draw flag pole
+    pole_x = x + width // 3
+    pole_top = y + height // 6
+    pole_bottom = y + 5 * height // 6
+    pygame.draw.line(screen, COLOR_TEXT, (pole_x, pole_top), (pole_x, pole_bottom), 2)
+
+    # Draw flag
+    flag_size = width // 3
+    flag_rect = pygame.Rect(pole_x, y + height // 6, flag_size, flag_size)
+    pygame.draw.rect(screen, COLOR_FLAG, flag_rect)
+    pygame.draw.rect(screen, COLOR_TEXT, flag_rect, 1)
+
+
+def _draw_mine_shape(screen: pygame.Surface, x: int, y: int, width: int, height: int,
+                     color: Tuple[int, int, int], spikes: bool = True) -> None:
+    """Draw a mine inside the cell whose top-left corner is (x, y)."""
+    center_x = x + width // 2
+    center_y = y + height // 2
+    radius = width // 4
+
+    # Draw mine as a circle
+    pygame.draw.circle(screen, color, (center_x, center_y), radius)
+
+    if spikes:
+        for start_x, start_y, end_x, end_y in _spike_offsets(radius):
+            pygame.draw.line(screen, color, (center_x + start_x, center_y + start_y),
+                             (center_x + end_x, center_y + end_y), 2)
+
 
 class CellRenderer:
     """Handles visual representation of individual cells."""
 
-    def __init__(self, cell: Cell, x: int, y: int):
+    def __init__(self, cell: CellBase, x: int, y: int):
         """Initialize cell renderer.
 
         Args:
@@ -29,10 +157,18 @@ class CellRenderer:
         self.height = CELL_SIZE
         self.rect = pygame.Rect(x, y, self.width, self.height)
         self.font = None
+        self.digit_surfaces: Optional[Dict[int, pygame.Surface]] = None
+
+    def set_font(self, font: pygame.font.Font,
+                 digit_surfaces: Optional[Dict[int, pygame.Surface]] = None) -> None:
+        """Set the font for text rendering.
 
-    def set_font(self, font: pygame.font.Font) -> None:
-        """Set the font for text rendering."""
+        Args:
+            font: Font used for text rendering
+            digit_surfaces: Optional pre-rendered surfaces for numbers 1-8
+        """
         self.font = font
+        self.digit_surfaces = digit_surfaces
 
     def render(self, screen: pygame.Surface, game_over: bool = False) -> None:
         """Render the cell on the screen.
@@ -70,22 +206,7 @@ class CellRenderer:
 
     def _draw_flag(self, screen: pygame.Surface) -> None:
         """Draw a flag on the cell."""
-        # Draw flag pole
-        pole_x = self.x + self.width // 3
-        pole_top = self.y + self.height // 6
-        pole_bottom = self.y + 5 * self.height // 6
-        pygame.draw.line(screen, COLOR_TEXT, (pole_x, pole_top), (pole_x, pole_bottom), 2)
-
-        # Draw flag
-        flag_size = self.width // 3
-        flag_rect = pygame.Rect(
-            pole_x,
-            self.y + self.height // 6,
-            flag_size,
-            flag_size
-        )
-        pygame.draw.rect(screen, COLOR_FLAG, flag_rect)
-        pygame.draw.rect(screen, COLOR_TEXT, flag_rect, 1)
+        _draw_flag_shape(screen, self.x, self.y, self.width, self.height)
 
     def _draw_revealed_cell(self, screen: pygame.Surface, game_over: bool) -> None:
         """Draw a revealed cell."""
@@ -97,35 +218,20 @@ class CellRenderer:
     def _draw_mine(self, screen: pygame.Surface, game_over: bool) -> None:
         """Draw a mine."""
         color = COLOR_MINE if game_over else COLOR_TEXT
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
-        radius = self.width // 4
-
-        # Draw mine as a circle
-        pygame.draw.circle(screen, color, (center_x, center_y), radius)
-
         # Draw mine spikes (only if game is over or mine is revealed)
-        if game_over or self.cell.is_revealed:
-            spike_length = radius // 2
-            for angle in range(0, 360, 45):
-                rad_angle = angle * 3.14159 / 180
-                spike_x = center_x + int(radius * 1.2 * pygame.math.Vector2(1, 0).rotate(angle).x)
-                spike_y = center_y + int(radius * 1.2 * pygame.math.Vector2(1, 0).rotate(angle).y)
-                end_x = center_x + int((radius + spike_length) * pygame.math.Vector2(1, 0).rotate(angle).x)
-                end_y = center_y + int((radius + spike_length) * pygame.math.Vector2(1, 0).rotate(angle).y)
-                pygame.draw.line(screen, color, (spike_x, spike_y), (end_x, end_y), 2)
+        spikes = game_over or self.cell.is_revealed
+        _draw_mine_shape(screen, self.x, self.y, self.width, self.height, color, spikes)
 
     def _draw_number(self, screen: pygame.Surface) -> None:
         """Draw the number of adjacent mines."""
-        if not self.font:
-            return
+        number = self.cell.adjacent_mines
+        text_surface = self.digit_surfaces.get(number) if self.digit_surfaces else None
 
-        # Get color based on number
-        color = self._get_number_color(self.cell.adjacent_mines)
+        if text_surface is None:
+            if not self.font:
+                return
+            text_surface = self.font.render(str(number), True, self._get_number_color(number))
 
-        # Render number text
-        text = str(self.cell.adjacent_mines)
-        text_surface = self.font.render(text, True, color)
         text_rect = text_surface.get_rect(center=self.rect.center)
 
         # Draw text
@@ -133,17 +239,9 @@ class CellRenderer:
 
     def _get_number_color(self, number: int) -> Tuple[int, int, int]:
         """Get the color for a number based on standard minesweeper colors."""
-        colors = {
-            1: COLOR_NUMBER_1,
-            2: COLOR_NUMBER_2,
-            3: COLOR_NUMBER_3,
-            4: COLOR_NUMBER_4,
-            5: COLOR_NUMBER_5,
-            6: COLOR_NUMBER_6,
-            7: COLOR_NUMBER_7,
-            8: COLOR_NUMBER_8,
-        }
-        return colors.get(number, COLOR_TEXT)
+        if 0 <= number <= 8:
+            return _NUMBER_COLORS[number]
+        return COLOR_TEXT
 
     def is_point_inside(self, pos: Tuple[int, int]) -> bool:
         """Check if a point is inside the cell.
@@ -173,6 +271,152 @@ class CellRenderer:
         return (self.cell.row, self.cell.col)
 
 
+# Visual keys of board cells, used to index the baked cell surfaces;
+# numbers use _KEY_NUMBER + count, so revealed empty cells are _KEY_NUMBER
+_KEY_HIDDEN = 0
+_KEY_FLAGGED = 1
+_KEY_MINE = 2
+_KEY_MINE_GAME_OVER = 3
+_KEY_NUMBER = 4
+_KEY_NOT_DRAWN = 255
+
+
+def bake_cell_surfaces(cell_size: int,
+                       digit_surfaces: Optional[Dict[int, pygame.Surface]] = None
+                       ) -> Tuple[pygame.Surface, ...]:
+    """Pre-render every distinct cell appearance.
+
+    Args:
+        cell_size: Size of each cell in pixels
+        digit_surfaces: Pre-rendered surfaces for numbers 1-8
+
+    Returns:
+        Cell-sized surfaces indexed by visual key: hidden, flagged, mine,
+        game-over mine, then revealed cells with 0-8 adjacent mines
+    """
+    digit_surfaces = digit_surfaces or {}
+
+    def tile(color: Tuple[int, int, int]) -> pygame.Surface:
+        surface = to_display_format(pygame.Surface((cell_size, cell_size)))
+        surface.fill(color)
+        pygame.draw.rect(surface, COLOR_BORDER, surface.get_rect(), 1)
+        return surface
+
+    flagged = tile(COLOR_REVEALED)
+    _draw_flag_shape(flagged, 0, 0, cell_size, cell_size)
+    mine = tile(COLOR_REVEALED)
+    _draw_mine_shape(mine, 0, 0, cell_size, cell_size, COLOR_TEXT)
+    mine_game_over = tile(COLOR_REVEALED)
+    _draw_mine_shape(mine_game_over, 0, 0, cell_size, cell_size, COLOR_MINE)
+
+    numbers = []
+    for number in range(9):
+        surface = tile(COLOR_REVEALED)
+        digit = digit_surfaces.get(number)
+        if digit is not None:
+            surface.blit(digit, (cell_size // 2 - digit.get_width() // 2,
+                                 cell_size // 2 - digit.get_height() // 2))
+        numbers.append(surface)
+
+    return (tile(COLOR_HIDDEN), flagged, mine, mine_game_over, *numbers)
+
+
+class CellRenderGrid:
+    """Renders a whole board by blitting pre-rendered cell surfaces.
+
+    Screen positions are stored as a flat list indexed like the board's
+    cell arrays (``row * width + col``). Every distinct cell appearance is
+    baked once into a surface, so a render is a single ``Surface.blits``
+    call over the cells that changed.
+
+    The grid remembers what it last drew in each cell and only redraws
+    cells whose appearance changed, so the screen must keep the previous
+    frame's board pixels. Call ``invalidate`` after anything else has drawn
+    over the board to force a full redraw.
+    """
+
+    def __init__(self, board, offset_x: int, offset_y: int,
+                 cell_size: int = CELL_SIZE, cell_padding: int = CELL_PADDING,
+                 cell_surfaces: Optional[Tuple[pygame.Surface, ...]] = None):
+        """Initialize the render grid.
+
+        Args:
+            board: Board whose cell arrays are rendered
+            offset_x: X offset for the entire grid
+            offset_y: Y offset for the entire grid
+            cell_size: Size of each cell in pixels
+            cell_padding: Padding between cells
+            cell_surfaces: Surfaces from ``bake_cell_surfaces``; baked
+                without numbers if not given
+        """
+        self.board = board
+        self.cell_size = cell_size
+        stride = cell_size + cell_padding
+        width = board.width
+        cell_count = board.width * board.height
+
+        self.positions = [
+            (offset_x + (index % width) * stride, offset_y + (index // width) * stride)
+            for index in range(cell_count)
+        ]
+        self.rect = pygame.Rect(offset_x, offset_y,
+                                board.width * stride - cell_padding,
+                                board.height * stride - cell_padding)
+        self.cell_surfaces = cell_surfaces or bake_cell_surfaces(cell_size)
+
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Mark every cell as not drawn so the next render redraws the board."""
+        self._drawn = bytearray([_KEY_NOT_DRAWN]) * len(self.positions)
+        self._last_state = None
+
+    def render(self, screen: pygame.Surface, game_over: bool = False) -> List[pygame.Rect]:
+        """Render the cells that changed since the last render.
+
+        Args:
+            screen: Pygame screen surface
+            game_over: Whether the game is over (mines drawn in red)
+
+        Returns:
+            Screen rects of the cells that were redrawn
+        """
+        board = self.board
+        is_revealed = board.is_revealed
+        is_flagged = board.is_flagged
+        is_mine = board.is_mine
+        adjacent = board.adjacent
+
+        # Nothing to do if no cell was revealed or flagged since last time
+        state = (bytes(is_revealed), bytes(is_flagged), game_over)
+        if state == self._last_state:
+            return []
+        self._last_state = state
+
+        drawn = self._drawn
+        surfaces = self.cell_surfaces
+        mine_key = _KEY_MINE_GAME_OVER if game_over else _KEY_MINE
+
+        blits = []
+        for index, position in enumerate(self.positions):
+            if is_flagged[index]:
+                key = _KEY_FLAGGED
+            elif not is_revealed[index]:
+                key = _KEY_HIDDEN
+            elif is_mine[index]:
+                key = mine_key
+            else:
+                key = _KEY_NUMBER + adjacent[index]
+
+            if drawn[index] != key:
+                drawn[index] = key
+                blits.append((surfaces[key], position))
+
+        if not blits:
+            return []
+        return screen.blits(blits)
+
+
 class CellRendererFactory:
     """Factory for creating cell renderers."""
 
@@ -186,17 +430,26 @@ class CellRendererFactory:
         self.cell_size = cell_size
         self.cell_padding = cell_padding
         self.font = None
+        self.digit_surfaces: Dict[int, pygame.Surface] = {}
         self._initialize_font()
+        self.cell_surfaces = bake_cell_surfaces(cell_size, self.digit_surfaces)
 
     def _initialize_font(self) -> None:
-        """Initialize the font for rendering numbers."""
+        """Initialize the font and pre-render the numbers 1-8."""
         try:
-            self.font = pygame.font.Font(None, FONT_SIZE_MEDIUM)
+            self.font = get_font(FONT_SIZE_MEDIUM)
         except pygame.error:
             # Fallback if font loading fails
             self.font = None
+            self.digit_surfaces = {}
+            return
+
+        self.digit_surfaces = {
+            number: self.font.render(str(number), True, _NUMBER_COLORS[number])
+            for number in range(1, 9)
+        }
 
-    def create_renderer(self, cell: Cell, row: int, col: int, offset_x: int = 0, offset_y: int = 0) -> CellRenderer:
+    def create_renderer(self, cell: CellBase, row: int, col: int, offset_x: int = 0, offset_y: int = 0) -> CellRenderer:
         """Create a cell renderer for the given cell.
 
         Args:
@@ -213,5 +466,19 @@ class CellRendererFactory:
         y = offset_y + row * (self.cell_size + self.cell_padding)
 
         renderer = CellRenderer(cell, x, y)
-        renderer.set_font(self.font)
-        return renderer
\ No newline at end of file
+        renderer.set_font(self.font, self.digit_surfaces)
+        return renderer
+
+    def create_grid(self, board, offset_x: int = 0, offset_y: int = 0) -> CellRenderGrid:
+        """Create a render grid for the whole board.
+
+        Args:
+            board: Board to render
+            offset_x: X offset for the entire grid
+            offset_y: Y offset for the entire grid
+
+        Returns:
+            CellRenderGrid instance
+        """
+        return CellRenderGrid(board, offset_x, offset_y, self.cell_size,
+                              self.cell_padding, self.cell_surfaces)
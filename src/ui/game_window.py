@@ -2,48 +2,134 @@
 
 import pygame
 import sys
-from typing import Optional, Tuple, Dict, Any
-from game.game_state import GameSession, GameState, create_game_session
-from game.difficulty import DifficultyPreset
-from ui.cell_renderer import CellRendererFactory
-from ui.input_handler import InputHandler
-from config import (
-    WINDOW_TITLE, WINDOW_WIDTH, WINDOW_HEIGHT, FPS_TARGET,
+from typing import Optional, Tuple, Dict, Any, List, Callable
+from ..game.game_state import GameSession, GameState, create_game_session
+from ..game.difficulty import DifficultyPreset
+from .cell_renderer import (
+    CellRenderGrid, CellRendererFactory, clear_text_caches, get_font, render_text
+)
+from .input_handler import Action, InputHandler
+from ..config import (
+    WINDOW_TITLE, WINDOW_WIDTH, WINDOW_HEIGHT, STATUS_REFRESH_MS, MAX_DIRTY_RECTS,
     COLOR_TEXT, COLOR_HIDDEN, FONT_SIZE_MEDIUM, FONT_SIZE_LARGE
 )
 
+# Timer event that wakes the main loop to refresh the elapsed time
+STATUS_TICK_EVENT = pygame.USEREVENT + 1
+
+# Event types where only the latest pending event needs handling
+COALESCED_EVENT_TYPES = frozenset((
+    pygame.MOUSEMOTION, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, STATUS_TICK_EVENT
+))
+
+# Event types the game handles; all others are dropped by SDL
+ALLOWED_EVENT_TYPES = [
+    pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, STATUS_TICK_EVENT,
+]
+
+# Difficulty that the new-game key switches to from each preset
+NEXT_DIFFICULTY = {
+    'beginner': 'intermediate',
+    'intermediate': 'advanced',
+    'advanced': 'beginner',
+}
+
 
 class GameWindow:
     """Main game window and rendering manager."""
 
     def __init__(self):
         """Initialize the game window."""
-        pygame.init()
+        # Fonts and text cached by an earlier window died with its pygame session
+        clear_text_caches()
+
+        # Only the subsystems the game uses; skips audio and joystick probing
+        pygame.display.init()
         pygame.font.init()
 
         # Screen setup
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption(WINDOW_TITLE)
 
+        # Keep unused events (motion, key release, devices) off the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENT_TYPES)
+
+        # Arming the timer also starts SDL's timer subsystem, so
+        # pygame.time.get_ticks() counts from window creation
+        pygame.time.set_timer(STATUS_TICK_EVENT, STATUS_REFRESH_MS)
+
         # Game state
         self.game_session: Optional[GameSession] = None
-        self.cell_renderers: Dict[Tuple[int, int], 'CellRenderer'] = {}
+        self.cell_render_grid: Optional[CellRenderGrid] = None
         self.cell_renderer_factory = CellRendererFactory()
 
         # UI components
-        self.font_medium = pygame.font.Font(None, FONT_SIZE_MEDIUM)
-        self.font_large = pygame.font.Font(None, FONT_SIZE_LARGE)
+        self.font_medium = get_font(FONT_SIZE_MEDIUM)
+        self.font_large = get_font(FONT_SIZE_LARGE)
         self.input_handler = InputHandler()
+        self._action_handlers: Dict[Action, Callable[..., None]] = {
+            Action.LEFT_CLICK: self._handle_left_click,
+            Action.RIGHT_CLICK: self._handle_right_click,
+            Action.DOUBLE_CLICK: self._handle_double_click,
+            Action.PAUSE_RESUME: self._toggle_pause,
+            Action.RESTART: self._restart_game,
+            Action.NEW_GAME: self._show_difficulty_menu,
+            Action.SET_DIFFICULTY: self.start_new_game,
+        }
+
+        # Constant status bar texts as (surface, rect), centered once
+        self._controls_text = self._create_centered_text(
+            self.font_medium,
+            "Controls: Left-click reveal, Right-click flag, Double-click expand, Space pause, ESC quit",
+            WINDOW_HEIGHT - 60
+        )
+        self._game_over_messages = {
+            GameState.WON: self._create_centered_text(
+                self.font_large, "You Win! Press R to restart or N for new game", WINDOW_HEIGHT - 30
+            ),
+            GameState.LOST: self._create_centered_text(
+                self.font_large, "Game Over! Press R to restart or N for new game", WINDOW_HEIGHT - 30
+            ),
+        }
 
         # Game settings
         self.board_offset_x = 50
         self.board_offset_y = 100
         self.status_bar_height = 80
 
+        # Screen areas holding status text, cleared every frame
+        self.status_rects = (
+            pygame.Rect(0, 0, WINDOW_WIDTH, self.status_bar_height),
+            pygame.Rect(0, WINDOW_HEIGHT - self.status_bar_height, WINDOW_WIDTH, self.status_bar_height),
+        )
+        self._needs_full_redraw = True
+
+        # Statistics shown in the status bar, refreshed when marked dirty
+        self._cached_stats: Optional[Dict[str, Any]] = None
+        self._stats_dirty = True
+        self._drawn_status_texts: Optional[Tuple[str, str, str, str]] = None
+
         # Game loop
-        self.clock = pygame.time.Clock()
         self.running = True
 
+    @staticmethod
+    def _create_centered_text(font: pygame.font.Font, text: str,
+                              center_y: int) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Render text horizontally centered in the window.
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            center_y: Vertical center of the text
+
+        Returns:
+            Tuple of the text surface and its screen rect
+        """
+        surface = render_text(font, text, COLOR_TEXT)
+        return surface, surface.get_rect(center=(WINDOW_WIDTH // 2, center_y))
+
     def start_new_game(self, difficulty_name: str = "beginner", **custom_settings) -> None:
         """Start a new game with the specified difficulty.
 
@@ -52,6 +138,7 @@ class GameWindow:
             **custom_settings: Custom settings for custom difficulty
         """
         self.game_session = create_game_session(difficulty_name, **custom_settings)
+        self._stats_dirty = True
         self._create_cell_renderers()
 
     def _create_cell_renderers(self) -> None:
@@ -59,40 +146,85 @@ class GameWindow:
         if not self.game_session:
             return
 
-        self.cell_renderers.clear()
         board = self.game_session.board
-
-        for row in range(board.height):
-            for col in range(board.width):
-                cell = board.cells[row][col]
-                renderer = self.cell_renderer_factory.create_renderer(
-                    cell, row, col, self.board_offset_x, self.board_offset_y
-                )
-                self.cell_renderers[(row, col)] = renderer
+        factory = self.cell_renderer_factory
+        self.cell_render_grid = factory.create_grid(board, self.board_offset_x, self.board_offset_y)
+        self.input_handler.configure_board(
+            factory.cell_size, self.board_offset_x, self.board_offset_y,
+            board.width, board.height, factory.cell_padding
+        )
+        self._needs_full_redraw = True
 
     def run(self) -> None:
-        """Run the main game loop."""
+        """Run the main game loop.
+
+        The loop sleeps until an event arrives instead of rendering at a
+        fixed frame rate. A periodic timer event keeps the elapsed time in
+        the status bar current while the player is idle.
+        """
         # Start with beginner difficulty by default
         self.start_new_game("beginner")
 
         while self.running:
-            self._handle_events()
-            self._update_game()
+            first_event = pygame.event.wait()
+            self._handle_events([first_event] + pygame.event.get())
             self._render()
-            self.clock.tick(FPS_TARGET)
 
+        clear_text_caches()
         pygame.quit()
         sys.exit()
 
-    def _handle_events(self) -> None:
-        """Handle pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+    def _handle_events(self, events: Optional[List[pygame.event.Event]] = None) -> None:
+        """Handle a batch of pygame events.
+
+        A quit request stops handling of the whole batch. Events whose type
+        is in COALESCED_EVENT_TYPES are reduced to the latest of each type
+        and handled after the remaining events, which keep their order.
+
+        Args:
+            events: Events to handle, or None to take all pending events
+        """
+        if events is None:
+            events = pygame.event.get()
+
+        latest_by_type: Dict[int, pygame.event.Event] = {}
+        ordered = []
+        for event in events:
+            if event.type in COALESCED_EVENT_TYPES:
+                latest_by_type[event.type] = event
+            elif self._is_quit_event(event):
                 self.running = False
+                return
             else:
-                self._handle_game_event(event)
+                ordered.append(event)
+
+        for event in ordered:
+            self._handle_event(event)
+        for event in latest_by_type.values():
+            self._handle_event(event)
+
+    @staticmethod
+    def _is_quit_event(event: pygame.event.Event) -> bool:
+        """Check whether an event asks to close the game."""
+        return (event.type == pygame.QUIT
+                or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE))
+
+    def _handle_event(self, event: pygame.event.Event) -> None:
+        """Handle a single pygame event.
+
+        Args:
+            event: Pygame event
+        """
+        if self._is_quit_event(event):
+            self.running = False
+        elif event.type == STATUS_TICK_EVENT:
+            # Elapsed time has moved on
+            self._stats_dirty = True
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            # Window contents were lost; partial updates are not enough
+            self._needs_full_redraw = True
+        else:
+            self._handle_game_event(event)
 
     def _handle_game_event(self, event: pygame.event.Event) -> None:
         """Handle game-specific events.
@@ -104,22 +236,12 @@ class GameWindow:
         if not action or not self.game_session:
             return
 
-        action_type = action['type']
-
-        if action_type == 'left_click':
-            self._handle_left_click(action['position'])
-        elif action_type == 'right_click':
-            self._handle_right_click(action['position'])
-        elif action_type == 'double_click':
-            self._handle_double_click(action['position'])
-        elif action_type == 'pause_resume':
-            self._toggle_pause()
-        elif action_type == 'restart':
-            self._restart_game()
-        elif action_type == 'new_game':
-            self._show_difficulty_menu()
-        elif action_type == 'set_difficulty':
-            self.start_new_game(action['difficulty'])
+        # Any action may change what the status bar shows
+        self._stats_dirty = True
+
+        handler = self._action_handlers.get(action[0])
+        if handler:
+            handler(*action[1:])
 
     def _handle_left_click(self, position: Tuple[int, int]) -> None:
         """Handle left mouse click.
@@ -130,10 +252,7 @@ class GameWindow:
         if not self.game_session or self.game_session.is_game_over():
             return
 
-        grid_pos = self.input_handler.screen_to_grid(
-            position, self.cell_renderer_factory.cell_size,
-            self.board_offset_x, self.board_offset_y
-        )
+        grid_pos = self.input_handler.cell_at(position)
 
         if grid_pos:
             row, col = grid_pos
@@ -152,10 +271,7 @@ class GameWindow:
         if not self.game_session or self.game_session.is_game_over():
             return
 
-        grid_pos = self.input_handler.screen_to_grid(
-            position, self.cell_renderer_factory.cell_size,
-            self.board_offset_x, self.board_offset_y
-        )
+        grid_pos = self.input_handler.cell_at(position)
 
         if grid_pos:
             row, col = grid_pos
@@ -174,10 +290,7 @@ class GameWindow:
         if not self.game_session or self.game_session.is_game_over():
             return
 
-        grid_pos = self.input_handler.screen_to_grid(
-            position, self.cell_renderer_factory.cell_size,
-            self.board_offset_x, self.board_offset_y
-        )
+        grid_pos = self.input_handler.cell_at(position)
 
         if grid_pos:
             row, col = grid_pos
@@ -211,92 +324,125 @@ class GameWindow:
             return
 
         current_difficulty = self.game_session.difficulty.name.lower()
-        difficulties = ['beginner', 'intermediate', 'advanced']
 
-        try:
-            current_index = difficulties.index(current_difficulty)
-            next_index = (current_index + 1) % len(difficulties)
-            self.start_new_game(difficulties[next_index])
-        except ValueError:
-            # Current difficulty not in list (custom), start with beginner
-            self.start_new_game('beginner')
-
-    def _update_game(self) -> None:
-        """Update game state."""
-        # Game state updates are handled by the game session
-        pass
+        # Custom difficulty is not in the cycle; start with beginner
+        self.start_new_game(NEXT_DIFFICULTY.get(current_difficulty, 'beginner'))
 
     def _render(self) -> None:
-        """Render the game."""
-        # Clear screen
-        self.screen.fill(COLOR_HIDDEN)
+        """Render the game.
+
+        The board is drawn incrementally and the status areas are redrawn
+        only when their text changes; when nothing changed, no drawing or
+        display update happens at all. The whole screen is cleared when a
+        new board is shown or when the board overlaps the status areas.
+        """
+        grid = self.cell_render_grid
+        full_redraw = (self._needs_full_redraw or grid is None
+                       or grid.rect.collidelist(self.status_rects) != -1)
+        status_texts = self._get_status_texts()
+        status_changed = full_redraw or status_texts != self._drawn_status_texts
+
+        if full_redraw:
+            # Clear screen
+            self.screen.fill(COLOR_HIDDEN)
+            if grid is not None:
+                grid.invalidate()
+            self._needs_full_redraw = False
+        elif status_changed:
+            for rect in self.status_rects:
+                self.screen.fill(COLOR_HIDDEN, rect)
 
         # Render status bar
-        self._render_status_bar()
+        if status_changed:
+            self._render_status_bar(status_texts)
+            self._drawn_status_texts = status_texts
 
         # Render game board
-        if self.game_session:
-            self._render_board()
+        dirty_rects = self._render_board()
 
         # Update display
-        pygame.display.flip()
+        if full_redraw:
+            pygame.display.flip()
+            return
+
+        if len(dirty_rects) > MAX_DIRTY_RECTS:
+            # Many small updates cost more than one covering rect
+            dirty_rects = [dirty_rects[0].unionall(dirty_rects[1:])]
+        if status_changed:
+            dirty_rects.extend(self.status_rects)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
 
-    def _render_status_bar(self) -> None:
-        """Render the status bar with game information."""
+    def _get_status_texts(self) -> Optional[Tuple[str, str, str, str]]:
+        """Get the texts shown in the status bar.
+
+        Returns:
+            Tuple of state, difficulty, mines and time texts, or None if no
+            game is active
+        """
         if not self.game_session:
+            return None
+
+        if self._stats_dirty or self._cached_stats is None:
+            self._cached_stats = self.game_session.get_statistics()
+            self._stats_dirty = False
+        stats = self._cached_stats
+
+        mines_remaining = stats['mine_count'] - stats['flagged_count']
+        duration = stats.get('duration', 0) or 0
+        return (
+            f"State: {stats['state'].title()}",
+            f"Difficulty: {stats['difficulty']}",
+            f"Mines: {mines_remaining}",
+            f"Time: {int(duration)}s",
+        )
+
+    def _render_status_bar(self, status_texts: Optional[Tuple[str, str, str, str]]) -> None:
+        """Render the status bar with game information.
+
+        Args:
+            status_texts: Texts from _get_status_texts
+        """
+        if not status_texts:
             return
 
-        stats = self.game_session.get_statistics()
+        state_text, difficulty_text, mines_text, time_text = status_texts
 
         # Game state text
-        state_text = f"State: {stats['state'].title()}"
-        state_surface = self.font_medium.render(state_text, True, COLOR_TEXT)
+        state_surface = render_text(self.font_medium, state_text, COLOR_TEXT)
         self.screen.blit(state_surface, (10, 10))
 
         # Difficulty text
-        difficulty_text = f"Difficulty: {stats['difficulty']}"
-        difficulty_surface = self.font_medium.render(difficulty_text, True, COLOR_TEXT)
+        difficulty_surface = render_text(self.font_medium, difficulty_text, COLOR_TEXT)
         self.screen.blit(difficulty_surface, (10, 35))
 
         # Mines remaining
-        mines_remaining = stats['mine_count'] - stats['flagged_count']
-        mines_text = f"Mines: {mines_remaining}"
-        mines_surface = self.font_medium.render(mines_text, True, COLOR_TEXT)
+        mines_surface = render_text(self.font_medium, mines_text, COLOR_TEXT)
         self.screen.blit(mines_surface, (200, 10))
 
         # Time elapsed
-        duration = stats.get('duration', 0) or 0
-        time_text = f"Time: {int(duration)}s"
-        time_surface = self.font_medium.render(time_text, True, COLOR_TEXT)
+        time_surface = render_text(self.font_medium, time_text, COLOR_TEXT)
         self.screen.blit(time_surface, (200, 35))
 
         # Game over message
-        if self.game_session.is_game_over():
-            if self.game_session.state == GameState.WON:
-                message = "You Win! Press R to restart or N for new game"
-            else:
-                message = "Game Over! Press R to restart or N for new game"
-
-            message_surface = self.font_large.render(message, True, COLOR_TEXT)
-            message_rect = message_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 30))
-            self.screen.blit(message_surface, message_rect)
+        message = self._game_over_messages.get(self.game_session.state)
+        if message:
+            self.screen.blit(*message)
 
         # Controls help
-        controls_text = "Controls: Left-click reveal, Right-click flag, Double-click expand, Space pause, ESC quit"
-        controls_surface = self.font_medium.render(controls_text, True, COLOR_TEXT)
-        controls_rect = controls_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 60))
-        self.screen.blit(controls_surface, controls_rect)
+        self.screen.blit(*self._controls_text)
+
+    def _render_board(self) -> List[pygame.Rect]:
+        """Render the game board.
 
-    def _render_board(self) -> None:
-        """Render the game board."""
+        Returns:
+            Screen rects of the cells that were redrawn
+        """
         if not self.game_session:
-            return
+            return []
 
         game_over = self.game_session.is_game_over()
-
-        # Render each cell
-        for renderer in self.cell_renderers.values():
-            renderer.render(self.screen, game_over)
+        return self.cell_render_grid.render(self.screen, game_over)
 
     def get_game_stats(self) -> Optional[Dict[str, Any]]:
         """Get current game statistics.
@@ -319,6 +465,7 @@ def main():
         print("\nGame interrupted by user")
     except Exception as e:
         print(f"Error running game: {e}")
+        clear_text_caches()
         pygame.quit()
         sys.exit(1)
 
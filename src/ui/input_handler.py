@@ -2,7 +2,47 @@
 
 import pygame
 import time
-from typing import Optional, Tuple, Callable
+from enum import IntEnum
+from typing import Any, Dict, Optional, Tuple, Callable
+
+# Max distance in pixels on each axis between the clicks of a double click
+DOUBLE_CLICK_TOLERANCE = 5
+
+# Last click position before any click, far from any screen position
+NO_CLICK_POS = (-10000, -10000)
+
+
+class Action(IntEnum):
+    """Game actions produced by the input handler."""
+    LEFT_CLICK = 1
+    RIGHT_CLICK = 2
+    DOUBLE_CLICK = 3
+    PAUSE_RESUME = 4
+    RESTART = 5
+    NEW_GAME = 6
+    QUIT = 7
+    HELP = 8
+    SET_DIFFICULTY = 9
+
+
+# An Action followed by its arguments
+ActionTuple = Tuple[Any, ...]
+
+# Actions for bound keys; shared tuples, so key presses allocate nothing
+_KEY_ACTIONS: Dict[int, ActionTuple] = {
+    # Game controls
+    pygame.K_SPACE: (Action.PAUSE_RESUME,),
+    pygame.K_r: (Action.RESTART,),
+    pygame.K_n: (Action.NEW_GAME,),
+    pygame.K_ESCAPE: (Action.QUIT,),
+    pygame.K_h: (Action.HELP,),
+    pygame.K_F1: (Action.HELP,),
+
+    # Difficulty shortcuts
+    pygame.K_1: (Action.SET_DIFFICULTY, 'beginner'),
+    pygame.K_2: (Action.SET_DIFFICULTY, 'intermediate'),
+    pygame.K_3: (Action.SET_DIFFICULTY, 'advanced'),
+}
 
 
 class InputHandler:
@@ -13,16 +53,58 @@ class InputHandler:
         self.last_click_time = 0
         self.double_click_threshold = 300  # milliseconds
         self.last_click_button = None
-        self.last_click_pos = None
+        self.last_click_pos = NO_CLICK_POS
+
+        # Board geometry for cell_at, set by configure_board
+        self._stride = 1
+        self._origin_x = 0
+        self._origin_y = 0
+        self._board_pixel_width = 0
+        self._board_pixel_height = 0
+
+    def configure_board(self, cell_size: int, offset_x: int, offset_y: int,
+                        width: int, height: int, cell_padding: int = 1) -> None:
+        """Set the board geometry used by cell_at.
 
-    def handle_events(self, event: pygame.event.Event) -> Optional[dict]:
+        Args:
+            cell_size: Size of each cell in pixels
+            offset_x: X offset of the grid
+            offset_y: Y offset of the grid
+            width: Board width in cells
+            height: Board height in cells
+            cell_padding: Padding between cells in pixels
+        """
+        self._stride = cell_size + cell_padding
+        self._origin_x = offset_x
+        self._origin_y = offset_y
+        self._board_pixel_width = width * self._stride
+        self._board_pixel_height = height * self._stride
+
+    def cell_at(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Convert a screen position to a cell on the configured board.
+
+        Args:
+            pos: Screen position (x, y)
+
+        Returns:
+            Grid coordinates (row, col) or None if outside the board
+        """
+        x = pos[0] - self._origin_x
+        y = pos[1] - self._origin_y
+        if 0 <= x < self._board_pixel_width and 0 <= y < self._board_pixel_height:
+            return (y // self._stride, x // self._stride)
+        return None
+
+    def handle_events(self, event: pygame.event.Event) -> Optional[ActionTuple]:
         """Handle pygame events and return action information.
 
         Args:
             event: Pygame event to handle
 
         Returns:
-            Dictionary with action information, or None if no relevant action
+            Tuple of an Action followed by its arguments (the click
+            position, or the difficulty name for SET_DIFFICULTY), or None if
+            no relevant action
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
             return self._handle_mouse_click(event)
@@ -31,16 +113,17 @@ class InputHandler:
 
         return None
 
-    def _handle_mouse_click(self, event: pygame.event.Event) -> Optional[dict]:
+    def _handle_mouse_click(self, event: pygame.event.Event) -> Optional[ActionTuple]:
         """Handle mouse click events.
 
         Args:
             event: Mouse button down event
 
         Returns:
-            Action dictionary with type and position
+            Action tuple with the click position
         """
-        current_time = time.time() * 1000  # Convert to milliseconds
+        # Monotonic integer milliseconds; needs no pygame subsystem to be initialized
+        current_time = time.monotonic_ns() // 1_000_000
         pos = event.pos
         button = event.button
 
@@ -54,90 +137,29 @@ class InputHandler:
 
         # Determine action based on button and double-click
         if button == 1:  # Left click
-            if is_double_click:
-                return {
-                    'type': 'double_click',
-                    'position': pos,
-                    'button': button
-                }
-            else:
-                return {
-                    'type': 'left_click',
-                    'position': pos,
-                    'button': button
-                }
+            return (Action.DOUBLE_CLICK if is_double_click else Action.LEFT_CLICK, pos)
         elif button == 3:  # Right click
-            return {
-                'type': 'right_click',
-                'position': pos,
-                'button': button
-            }
+            return (Action.RIGHT_CLICK, pos)
 
         return None
 
-    def _handle_key_press(self, event: pygame.event.Event) -> Optional[dict]:
+    def _handle_key_press(self, event: pygame.event.Event) -> Optional[ActionTuple]:
         """Handle keyboard events.
 
         Args:
             event: Key down event
 
         Returns:
-            Action dictionary with key information
+            Action tuple for the key, or None if the key is unbound
         """
-        key = event.key
-
-        # Game controls
-        if key == pygame.K_SPACE:
-            return {
-                'type': 'pause_resume',
-                'key': 'space'
-            }
-        elif key == pygame.K_r:
-            return {
-                'type': 'restart',
-                'key': 'r'
-            }
-        elif key == pygame.K_n:
-            return {
-                'type': 'new_game',
-                'key': 'n'
-            }
-        elif key == pygame.K_ESCAPE:
-            return {
-                'type': 'quit',
-                'key': 'escape'
-            }
-        elif key == pygame.K_h or key == pygame.K_F1:
-            return {
-                'type': 'help',
-                'key': 'help'
-            }
-
-        # Difficulty shortcuts
-        elif key == pygame.K_1:
-            return {
-                'type': 'set_difficulty',
-                'difficulty': 'beginner',
-                'key': '1'
-            }
-        elif key == pygame.K_2:
-            return {
-                'type': 'set_difficulty',
-                'difficulty': 'intermediate',
-                'key': '2'
-            }
-        elif key == pygame.K_3:
-            return {
-                'type': 'set_difficulty',
-                'difficulty': 'advanced',
-                'key': '3'
-            }
+        return _KEY_ACTIONS.get(event.key)
 
-        return None
-
-    def _is_double_click(self, current_time: float, button: int, pos: Tuple[int, int]) -> bool:
+    def _is_double_click(self, current_time: int, button: int, pos: Tuple[int, int]) -> bool:
         """Check if this is a double click.
 
+        A double click is a press of the same button within the time
+        threshold and within DOUBLE_CLICK_TOLERANCE pixels on each axis.
+
         Args:
             current_time: Current time in milliseconds
             button: Mouse button that was clicked
@@ -146,63 +168,18 @@ class InputHandler:
         Returns:
             True if this is a double click
         """
-        if self.last_click_button is None:
-            return False
-
-        time_diff = current_time - self.last_click_time
-        same_button = button == self.last_click_button
-        same_position = self._is_same_position(pos, self.last_click_pos)
-
-        return (time_diff <= self.double_click_threshold and
-                same_button and
-                same_position)
-
-    def _is_same_position(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> bool:
-        """Check if two positions are the same (within tolerance).
-
-        Args:
-            pos1: First position
-            pos2: Second position
-
-        Returns:
-            True if positions are the same
-        """
-        if pos1 is None or pos2 is None:
-            return False
-
-        tolerance = 5  # pixels
-        return (abs(pos1[0] - pos2[0]) <= tolerance and
-                abs(pos1[1] - pos2[1]) <= tolerance)
-
-    def screen_to_grid(self, pos: Tuple[int, int], cell_size: int, offset_x: int = 0, offset_y: int = 0) -> Optional[Tuple[int, int]]:
-        """Convert screen position to grid coordinates.
-
-        Args:
-            pos: Screen position (x, y)
-            cell_size: Size of each cell in pixels
-            offset_x: X offset of the grid
-            offset_y: Y offset of the grid
-
-        Returns:
-            Grid coordinates (row, col) or None if outside grid
-        """
-        x, y = pos
-        x -= offset_x
-        y -= offset_y
-
-        if x < 0 or y < 0:
-            return None
-
-        col = x // (cell_size + 1)  # +1 for border
-        row = y // (cell_size + 1)
-
-        return (row, col)
+        # With no previous click, last_click_button is None and never matches
+        last_x, last_y = self.last_click_pos
+        return (button == self.last_click_button
+                and current_time - self.last_click_time <= self.double_click_threshold
+                and -DOUBLE_CLICK_TOLERANCE <= pos[0] - last_x <= DOUBLE_CLICK_TOLERANCE
+                and -DOUBLE_CLICK_TOLERANCE <= pos[1] - last_y <= DOUBLE_CLICK_TOLERANCE)
 
     def reset_click_tracking(self) -> None:
         """Reset click tracking for double-click detection."""
         self.last_click_time = 0
         self.last_click_button = None
-        self.last_click_pos = None
+        self.last_click_pos = NO_CLICK_POS
 
 
 class InputEvent:
@@ -5,6 +5,12 @@ from src.game.game_state import create_game_session, GameState
 from src.game.difficulty import DifficultyPreset
 
 
+def cells_where(board, mask):
+    """Get (row, col) of every cell whose entry in a flat board array is set."""
+    width = board.width
+    return [divmod(index, width) for index, value in enumerate(mask) if value]
+
+
 class TestGameFlow:
     """Test complete game flow scenarios."""
 
@@ -21,16 +27,14 @@ class TestGameFlow:
         # Make first click to generate mines (click top-left corner)
         session.make_move(0, 0, 'reveal')
 
-        # Find all safe cells (non-mines)
-        safe_cells = []
-        for row in range(board.height):
-            for col in range(board.width):
-                if not board.cells[row][col].is_mine:
-                    safe_cells.append((row, col))
+        # Find all safe cells (non-mines), empty ones first so each
+        # cascade opens as much of the board as possible
+        safe_cells = cells_where(board, [not is_mine for is_mine in board.is_mine])
+        safe_cells.sort(key=lambda pos: board.adjacent[pos[0] * board.width + pos[1]])
 
         # Reveal all safe cells to win, but skip already revealed ones
         for row, col in safe_cells:
-            if not board.cells[row][col].is_revealed:
+            if not board.is_revealed[row * board.width + col]:
                 success = session.make_move(row, col, 'reveal')
                 if session.state in [GameState.WON, GameState.LOST]:
                     break
@@ -52,11 +56,7 @@ class TestGameFlow:
         session.make_move(0, 0, 'reveal')
 
         # Find a mine and reveal it
-        mine_cells = []
-        for row in range(board.height):
-            for col in range(board.width):
-                if board.cells[row][col].is_mine:
-                    mine_cells.append((row, col))
+        mine_cells = cells_where(board, board.is_mine)
 
         assert len(mine_cells) > 0
 
@@ -82,11 +82,7 @@ class TestGameFlow:
         session.make_move(0, 0, 'reveal')
 
         # Find a mine and flag it
-        mine_cells = []
-        for row in range(board.height):
-            for col in range(board.width):
-                if board.cells[row][col].is_mine:
-                    mine_cells.append((row, col))
+        mine_cells = cells_where(board, board.is_mine)
 
         # Flag first mine
         mine_row, mine_col = mine_cells[0]
@@ -95,15 +91,10 @@ class TestGameFlow:
         assert board.cells[mine_row][mine_col].is_flagged is True
 
         # Find a hidden safe cell to reveal
-        safe_cell = None
-        for row in range(board.height):
-            for col in range(board.width):
-                if (not board.cells[row][col].is_mine and
-                    board.cells[row][col].is_hidden):
-                    safe_cell = (row, col)
-                    break
-            if safe_cell:
-                break
+        safe_cell = cells_where(board, [
+            not (is_mine or is_revealed or is_flagged)
+            for is_mine, is_revealed, is_flagged in zip(board.is_mine, board.is_revealed, board.is_flagged)
+        ])[0]
 
         # Reveal safe cell
         safe_row, safe_col = safe_cell
@@ -123,16 +114,9 @@ class TestGameFlow:
         # Start game
         session.start_game()
 
-        # Find a cell with adjacent mines
-        target_cell = None
-        for row in range(board.height):
-            for col in range(board.width):
-                if (not board.cells[row][col].is_mine and
-                    board.cells[row][col].adjacent_mines > 0):
-                    target_cell = (row, col)
-                    break
-            if target_cell:
-                break
+        # Find a cell with adjacent mines (mine cells keep a count of 0)
+        target_cells = cells_where(board, board.adjacent)
+        target_cell = target_cells[0] if target_cells else None
 
         if target_cell:
             row, col = target_cell
@@ -187,14 +171,7 @@ class TestGameFlow:
         session.make_move(0, 0, 'reveal')  # First click - generates mines
 
         # Find a mine to flag
-        mine_cell = None
-        for row in range(session.board.height):
-            for col in range(session.board.width):
-                if session.board.cells[row][col].is_mine:
-                    mine_cell = (row, col)
-                    break
-            if mine_cell:
-                break
+        mine_cell = cells_where(session.board, session.board.is_mine)[0]
 
         session.make_move(mine_cell[0], mine_cell[1], 'flag')  # Flag a mine
 
@@ -258,14 +235,7 @@ class TestGameFlow:
         session.make_move(0, 0, 'reveal')
 
         # Find a mine to flag
-        mine_cell = None
-        for row in range(session.board.height):
-            for col in range(session.board.width):
-                if session.board.cells[row][col].is_mine:
-                    mine_cell = (row, col)
-                    break
-            if mine_cell:
-                break
+        mine_cell = cells_where(session.board, session.board.is_mine)[0]
 
         # Flag a mine
         session.make_move(mine_cell[0], mine_cell[1], 'flag')
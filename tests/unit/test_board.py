@@ -2,7 +2,7 @@
 
 import pytest
 from src.game.board import Board
-from src.game.cell import Cell
+from src.game.cell import CellBase
 
 
 class TestBoardInitialization:
@@ -23,7 +23,7 @@ class TestBoardInitialization:
         board = Board(5, 4, 3)
         assert len(board.cells) == 4  # height
         assert len(board.cells[0]) == 5  # width
-        assert isinstance(board.cells[0][0], Cell)
+        assert isinstance(board.cells[0][0], CellBase)
 
     def test_board_cell_positions(self):
         """Test that cells have correct positions."""
@@ -51,6 +51,22 @@ class TestMineGeneration:
         board.generate_mines(safe_row, safe_col)
         assert (safe_row, safe_col) not in board.mine_positions
 
+    def test_safe_position_neighbors_not_mined(self):
+        """Test that the first click opens a mine-free 3x3 region."""
+        board = Board(9, 9, 10)
+        board.generate_mines(4, 4)
+        for row in range(3, 6):
+            for col in range(3, 6):
+                assert (row, col) not in board.mine_positions
+        assert board.cells[4][4].adjacent_mines == 0
+
+    def test_safe_zone_falls_back_on_dense_board(self):
+        """Test that only the clicked cell is kept clear when the board is too dense."""
+        board = Board(3, 3, 8)
+        board.generate_mines(1, 1)
+        assert len(board.mine_positions) == 8
+        assert (1, 1) not in board.mine_positions
+
     def test_mines_placed_on_cells(self):
         """Test that mines are properly placed on cells."""
         board = Board(5, 5, 5)
@@ -65,6 +81,20 @@ class TestMineGeneration:
 
         assert mine_count == 5
 
+    def test_mine_positions_setter_rewrites_mines(self):
+        """Test that assigning mine_positions replaces the mine layout."""
+        board = Board(3, 3, 2)
+        board.generate_mines(1, 1)
+
+        board.mine_positions = {(0, 0), (2, 2)}
+
+        assert board.mine_positions == {(0, 0), (2, 2)}
+        assert sum(board.is_mine) == 2
+        assert board.cells[0][0].is_mine is True
+        assert board.cells[1][1].adjacent_mines == 2
+        assert board.cells[0][1].adjacent_mines == 1
+        assert board.cells[0][0].adjacent_mines == 0
+
 
 class TestAdjacentMineCalculation:
     """Test adjacent mine counting."""
@@ -170,6 +200,15 @@ class TestCellRevealing:
         assert board.first_click is False
         assert len(board.mine_positions) == 2
 
+    def test_flagged_first_click_does_not_generate_mines(self):
+        """Test that a first click on a flagged cell leaves the board unmined."""
+        board = Board(3, 3, 2)
+        board.flag_cell(1, 1)
+
+        assert board.reveal_cell(1, 1) is False
+        assert board.first_click is True
+        assert len(board.mine_positions) == 0
+
     def test_reveal_empty_cell_expands_adjacent(self):
         """Test that revealing empty cell expands adjacent cells."""
         board = Board(5, 5, 1)
@@ -193,6 +232,32 @@ class TestCellRevealing:
             # Should reveal more than just this cell
             assert board.revealed_count > initial_revealed
 
+    def test_flood_fill_reveals_connected_region(self):
+        """Test that revealing an empty cell opens its whole region exactly once."""
+        board = Board(5, 5, 1)
+        board.cells[4][4].set_mine()
+        board.mine_positions = {(4, 4)}
+        board._calculate_adjacent_mines()
+
+        board.reveal_cell(0, 0)
+
+        assert board.revealed_count == 24
+        assert board.cells[4][4].is_revealed is False
+        assert board.check_win_condition() is True
+
+    def test_flood_fill_skips_flagged_cells(self):
+        """Test that flood fill does not reveal flagged cells."""
+        board = Board(5, 5, 1)
+        board.cells[4][4].set_mine()
+        board.mine_positions = {(4, 4)}
+        board._calculate_adjacent_mines()
+        board.flag_cell(0, 4)
+
+        board.reveal_cell(0, 0)
+
+        assert board.cells[0][4].is_flagged is True
+        assert board.revealed_count == 23
+
 
 class TestFlagging:
     """Test cell flagging functionality."""
@@ -295,6 +360,37 @@ class TestWinLoseConditions:
 
         assert board.check_lose_condition() is False
 
+    def test_lose_condition_mine_revealed_through_cell_view(self):
+        """Test that revealing a mine through a cell view loses the game."""
+        board = Board(3, 3, 1)
+        board.generate_mines(0, 0)
+        mine_row, mine_col = next(iter(board.mine_positions))
+
+        board.cells[mine_row][mine_col].reveal()
+
+        assert board.check_lose_condition() is True
+        assert board.revealed_count == 1
+
+    def test_cell_view_mutations_keep_counts(self):
+        """Test that revealing and flagging through views update the counters."""
+        board = Board(3, 3, 1)
+        board.mine_positions = {(2, 2)}
+        board._calculate_adjacent_mines()
+
+        board.cells[0][0].flag()
+        assert board.flagged_count == 1
+        board.cells[0][0].flag()
+        assert board.flagged_count == 0
+
+        for row in range(3):
+            for col in range(3):
+                if (row, col) != (2, 2):
+                    board.cells[row][col].reveal()
+
+        assert board.revealed_count == 8
+        assert board.check_win_condition() is True
+        assert board.check_lose_condition() is False
+
 
 class TestAutoExpansion:
     """Test auto-expansion functionality."""
@@ -382,6 +478,15 @@ class TestPositionValidation:
         assert cell.row == 2
         assert cell.col == 2
 
+    def test_get_cell_is_live_view(self):
+        """Test that get_cell returns a view that tracks board changes."""
+        board = Board(5, 5, 1)
+        cell = board.get_cell(1, 3)
+        assert cell.is_flagged is False
+
+        board.flag_cell(1, 3)
+        assert cell.is_flagged is True
+
     def test_invalid_row_too_low(self):
         """Test invalid row (too low)."""
         board = Board(5, 5, 1)
@@ -404,4 +509,56 @@ class TestPositionValidation:
         """Test invalid column (too high)."""
         board = Board(5, 5, 1)
         with pytest.raises(ValueError):
-            board.get_cell(2, 5)
\ No newline at end of file
+            board.get_cell(2, 5)
+
+
+class TestBoardStorage:
+    """Test struct-of-arrays cell storage."""
+
+    def test_arrays_sized_to_board(self):
+        """Test that per-cell arrays hold one entry per cell."""
+        board = Board(5, 4, 3)
+        for array in (board.is_mine, board.is_revealed, board.is_flagged, board.adjacent):
+            assert len(array) == 20
+
+    def test_cell_views_write_through(self):
+        """Test that cell views read and write the board arrays."""
+        board = Board(5, 4, 3)
+        cell = board.cells[2][3]
+        index = 2 * 5 + 3
+
+        cell.set_mine()
+        cell.set_adjacent_mines(4)
+        cell.flag()
+        assert board.is_mine[index] == 1
+        assert board.adjacent[index] == 4
+        assert board.is_flagged[index] == 1
+
+        board.flag_cell(2, 3)
+        assert cell.is_flagged is False
+        assert cell.is_hidden is True
+
+    def test_snapshot_is_a_copy(self):
+        """Test that snapshot returns immutable copies of the arrays."""
+        board = Board(5, 4, 3)
+        board.flag_cell(1, 2)
+        snapshot = board.snapshot()
+
+        assert snapshot['is_flagged'][1 * 5 + 2] == 1
+        board.flag_cell(1, 2)
+        assert snapshot['is_flagged'][1 * 5 + 2] == 1
+        assert set(snapshot) == {'is_mine', 'is_revealed', 'is_flagged', 'adjacent'}
+
+    def test_board_state_shape(self):
+        """Test that get_board_state returns one dict per cell in grid order."""
+        board = Board(5, 4, 3)
+        board.flag_cell(3, 1)
+        state = board.get_board_state()
+
+        assert len(state) == 4
+        assert len(state[0]) == 5
+        assert state[3][1]['row'] == 3
+        assert state[3][1]['col'] == 1
+        assert state[3][1]['is_flagged'] is True
+        assert state[3][1]['can_reveal'] is False
+        assert state[3][1]['can_flag'] is True
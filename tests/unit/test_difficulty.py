@@ -71,6 +71,15 @@ class TestDifficultyPreset:
         assert levels["intermediate"] == DifficultyPreset.INTERMEDIATE.level
         assert levels["advanced"] == DifficultyPreset.ADVANCED.level
 
+    def test_get_all_levels_is_read_only(self):
+        """Test that the shared levels mapping cannot be modified."""
+        levels = DifficultyPreset.get_all_levels()
+
+        with pytest.raises(TypeError):
+            levels["expert"] = DifficultyPreset.ADVANCED.level
+
+        assert DifficultyPreset.get_all_levels() is levels
+
     def test_get_by_name_valid(self):
         """Test getting difficulty by valid name."""
         beginner = DifficultyPreset.get_by_name("beginner")
@@ -1,18 +1,83 @@
 """Unit tests for GameSession and game state management."""
 
+import itertools
+
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from src.game.game_state import GameSession, GameState, create_game_session
 from src.game.difficulty import DifficultyPreset
+from src.game.validator import get_adjacent_positions
+
+
+# Fake clock: the first now() returns _CLOCK_START, each later call _CLOCK_STEP more
+_CLOCK_START = datetime(2024, 1, 1, 12, 0, 0)
+_CLOCK_STEP = timedelta(seconds=5)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace datetime in game_state with a deterministic stepping clock."""
+    times = (_CLOCK_START + i * _CLOCK_STEP for i in itertools.count())
+
+    class FakeDateTime:
+        @staticmethod
+        def now():
+            return next(times)
+
+    monkeypatch.setattr("src.game.game_state.datetime", FakeDateTime)
+    return _CLOCK_START
+
+
+def _bare_session() -> GameSession:
+    """A NEW-state session with no board, for tests of state predicates only."""
+    session = GameSession.__new__(GameSession)
+    session.state = GameState.NEW
+    session.start_time = None
+    session.end_time = None
+    return session
+
+
+@pytest.fixture
+def session():
+    """A fresh beginner session."""
+    return GameSession(DifficultyPreset.BEGINNER.level)
+
+
+@pytest.fixture
+def started_session():
+    """A fresh beginner session after start_game."""
+    session = GameSession(DifficultyPreset.BEGINNER.level)
+    session.start_game()
+    return session
+
+
+@pytest.fixture
+def opened_session():
+    """A fresh beginner session after start_game and a first reveal.
+
+    Returns:
+        Tuple of the session and the first revealed cell with adjacent mines
+    """
+    session = GameSession(DifficultyPreset.BEGINNER.level)
+    session.start_game()
+    # The first click always opens a region, whose border is numbered cells
+    session.make_move(4, 4, 'reveal')
+    board = session.board
+    first_numbered = next(
+        (row, col)
+        for row in range(board.height)
+        for col in range(board.width)
+        if board.cells[row][col].is_revealed and board.cells[row][col].adjacent_mines > 0
+    )
+    return session, first_numbered
 
 
 class TestGameSession:
     """Test GameSession functionality."""
 
-    def test_game_session_creation(self):
+    def test_game_session_creation(self, session):
         """Test game session creation."""
         difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
 
         assert session.id is not None
         assert session.difficulty == difficulty
@@ -30,56 +95,39 @@ class TestGameSession:
 
         assert session.id == custom_id
 
-    def test_start_game(self):
+    def test_start_game(self, session):
         """Test starting a game."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-
         assert session.state == GameState.NEW
         session.start_game()
         assert session.state == GameState.PLAYING
         assert session.start_time is not None
 
-    def test_start_game_already_playing(self):
+    def test_start_game_already_playing(self, started_session):
         """Test starting a game that's already playing."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-        session.start_game()
-
         # Starting again should not change state
-        original_start = session.start_time
-        session.start_game()
-        assert session.state == GameState.PLAYING
-        assert session.start_time == original_start
+        original_start = started_session.start_time
+        started_session.start_game()
+        assert started_session.state == GameState.PLAYING
+        assert started_session.start_time == original_start
 
-    def test_make_reveal_move(self):
+    def test_make_reveal_move(self, started_session):
         """Test making a reveal move."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-        session.start_game()
-
         # Make a reveal move
-        success = session.make_move(0, 0, 'reveal')
+        success = started_session.make_move(0, 0, 'reveal')
         assert success is True
-        assert session.moves_count == 1
-        assert session.board.cells[0][0].is_revealed is True
+        assert started_session.moves_count == 1
+        assert started_session.board.cells[0][0].is_revealed is True
 
-    def test_make_flag_move(self):
+    def test_make_flag_move(self, started_session):
         """Test making a flag move."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-        session.start_game()
-
         # Make a flag move
-        success = session.make_move(0, 0, 'flag')
+        success = started_session.make_move(0, 0, 'flag')
         assert success is True
-        assert session.flags_used == 1
-        assert session.board.cells[0][0].is_flagged is True
+        assert started_session.flags_used == 1
+        assert started_session.board.cells[0][0].is_flagged is True
 
-    def test_make_move_not_playing(self):
+    def test_make_move_not_playing(self, session):
         """Test making a move when not playing."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
         # Game not started
 
         # Should start the game automatically when making first move
@@ -88,107 +136,70 @@ class TestGameSession:
         assert session.state == GameState.PLAYING
         assert session.moves_count == 1
 
-    def test_make_move_invalid_action(self):
+    def test_make_move_invalid_action(self, started_session):
         """Test making a move with invalid action."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-        session.start_game()
-
         # Invalid action should be handled gracefully
-        success = session.make_move(0, 0, 'invalid')
+        success = started_session.make_move(0, 0, 'invalid')
         # Should return False for invalid action
         assert success is False
 
-    def test_expand_adjacent(self):
+    def test_expand_adjacent(self, opened_session):
         """Test expanding adjacent cells."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-        session.start_game()
+        session, (row, col) = opened_session
+        board = session.board
+
+        # Flag adjacent mines first
+        for adj_row, adj_col in get_adjacent_positions(row, col, board.width, board.height):
+            if board.cells[adj_row][adj_col].is_mine:
+                board.flag_cell(adj_row, adj_col)
 
-        # Find a cell to expand
-        for row in range(difficulty.height):
-            for col in range(difficulty.width):
-                if session.board.cells[row][col].adjacent_mines > 0:
-                    # Flag adjacent mines first
-                    adjacent_positions = []
-                    for dr in [-1, 0, 1]:
-                        for dc in [-1, 0, 1]:
-                            if dr == 0 and dc == 0:
-                                continue
-                            adj_row, adj_col = row + dr, col + dc
-                            if (0 <= adj_row < difficulty.height and
-                                0 <= adj_col < difficulty.width):
-                                if session.board.cells[adj_row][adj_col].is_mine:
-                                    session.board.flag_cell(adj_row, adj_col)
-
-                    # Now expand
-                    success = session.expand_adjacent(row, col)
-                    assert isinstance(success, bool)
-                    return
-
-        # If no suitable cell found, skip test
-        pytest.skip("No suitable cell found for expansion test")
-
-    def test_expand_adjacent_not_playing(self):
+        # Now expand
+        success = session.expand_adjacent(row, col)
+        assert isinstance(success, bool)
+        assert session.state != GameState.LOST
+
+    def test_expand_adjacent_not_playing(self, session):
         """Test expanding when not playing."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
         # Game not started
 
         with pytest.raises(ValueError, match="Cannot expand in state"):
             session.expand_adjacent(0, 0)
 
-    def test_pause_and_resume(self):
+    def test_pause_and_resume(self, started_session):
         """Test pausing and resuming game."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-        session.start_game()
+        assert started_session.state == GameState.PLAYING
 
-        assert session.state == GameState.PLAYING
-
-        session.pause_game()
-        assert session.state == GameState.PAUSED
+        started_session.pause_game()
+        assert started_session.state == GameState.PAUSED
 
-        session.resume_game()
-        assert session.state == GameState.PLAYING
+        started_session.resume_game()
+        assert started_session.state == GameState.PLAYING
 
-    def test_pause_not_playing(self):
+    def test_pause_not_playing(self, session):
         """Test pausing when not playing."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-
         # Should not change state
         session.pause_game()
         assert session.state == GameState.NEW
 
-    def test_resume_not_paused(self):
+    def test_resume_not_paused(self, started_session):
         """Test resuming when not paused."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-        session.start_game()
-
         # Should not change state
-        session.resume_game()
-        assert session.state == GameState.PLAYING
+        started_session.resume_game()
+        assert started_session.state == GameState.PLAYING
 
-    def test_get_game_duration(self):
+    def test_get_game_duration(self, session, fake_clock):
         """Test getting game duration."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-
         # Before start
         assert session.get_game_duration() is None
 
-        # After start
+        # After start; the clock advances one step between the two reads
         session.start_game()
-        duration = session.get_game_duration()
-        assert duration is not None
-        assert duration >= 0
+        assert session.start_time == fake_clock
+        assert session.get_game_duration() == _CLOCK_STEP.total_seconds()
 
-    def test_get_statistics(self):
+    def test_get_statistics(self, session, fake_clock):
         """Test getting game statistics."""
         difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
         session.start_game()
         session.make_move(0, 0, 'reveal')
 
@@ -204,14 +215,13 @@ class TestGameSession:
         assert stats['flags_used'] == 0
         assert stats['revealed_count'] >= 1  # May expand if adjacent_mines == 0
         assert stats['flagged_count'] == 0
-        assert stats['duration'] is not None
-        assert 'start_time' in stats
+        assert stats['duration'] == _CLOCK_STEP.total_seconds()
+        assert stats['start_time'] == fake_clock.isoformat()
         assert 'end_time' not in stats  # Game not over
 
     def test_is_game_over(self):
         """Test game over check."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
+        session = _bare_session()
 
         # New game
         assert session.is_game_over() is False
@@ -230,8 +240,7 @@ class TestGameSession:
 
     def test_is_game_active(self):
         """Test game active check."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
+        session = _bare_session()
 
         # New game
         assert session.is_game_active() is False
@@ -248,41 +257,33 @@ class TestGameSession:
         session.state = GameState.WON
         assert session.is_game_active() is False
 
-    def test_reset_game(self):
+    def test_reset_game(self, started_session):
         """Test resetting game."""
-        difficulty = DifficultyPreset.BEGINNER.level
-        session = GameSession(difficulty)
-        session.start_game()
-        session.make_move(0, 0, 'reveal')
+        started_session.make_move(0, 0, 'reveal')
 
         # Reset
-        session.reset_game()
+        started_session.reset_game()
 
-        assert session.state == GameState.NEW
-        assert session.start_time is None
-        assert session.end_time is None
-        assert session.moves_count == 0
-        assert session.flags_used == 0
-        assert session.board.revealed_count == 0
+        assert started_session.state == GameState.NEW
+        assert started_session.start_time is None
+        assert started_session.end_time is None
+        assert started_session.moves_count == 0
+        assert started_session.flags_used == 0
+        assert started_session.board.revealed_count == 0
 
 
 class TestGameSessionCreation:
     """Test game session creation helper function."""
 
-    def test_create_game_session_beginner(self):
-        """Test creating beginner game session."""
-        session = create_game_session("beginner")
-        assert session.difficulty == DifficultyPreset.BEGINNER.level
-
-    def test_create_game_session_intermediate(self):
-        """Test creating intermediate game session."""
-        session = create_game_session("intermediate")
-        assert session.difficulty == DifficultyPreset.INTERMEDIATE.level
-
-    def test_create_game_session_advanced(self):
-        """Test creating advanced game session."""
-        session = create_game_session("advanced")
-        assert session.difficulty == DifficultyPreset.ADVANCED.level
+    @pytest.mark.parametrize("name,preset", [
+        ("beginner", DifficultyPreset.BEGINNER),
+        ("intermediate", DifficultyPreset.INTERMEDIATE),
+        ("advanced", DifficultyPreset.ADVANCED),
+    ])
+    def test_create_game_session_preset(self, name, preset):
+        """Test creating a game session for each preset."""
+        session = create_game_session(name)
+        assert session.difficulty == preset.level
 
     def test_create_game_session_custom(self):
         """Test creating custom game session."""
@@ -0,0 +1,53 @@
+"""Unit tests for InputHandler click handling."""
+
+import itertools
+import time
+import pygame
+import pytest
+from src.ui.input_handler import Action, InputHandler
+
+# Start of the fake monotonic clock, in nanoseconds
+_CLOCK_START_NS = 10_000_000_000
+
+
+@pytest.fixture
+def handler():
+    """Create a fresh input handler."""
+    return InputHandler()
+
+
+def _fake_monotonic(monkeypatch, step_ms: int) -> None:
+    """Replace the handler's monotonic clock with one stepping step_ms per read."""
+    times = (_CLOCK_START_NS + i * step_ms * 1_000_000 for i in itertools.count())
+    monkeypatch.setattr("src.ui.input_handler.time.monotonic_ns", lambda: next(times))
+
+
+def _left_click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+
+
+class TestDoubleClick:
+    """Test double-click detection."""
+
+    def test_double_click_within_threshold(self, handler, monkeypatch):
+        """Test two quick clicks on the same spot form a double click."""
+        _fake_monotonic(monkeypatch, step_ms=100)
+
+        assert handler.handle_events(_left_click((60, 110)))[0] == Action.LEFT_CLICK
+        assert handler.handle_events(_left_click((62, 111)))[0] == Action.DOUBLE_CLICK
+
+    def test_slow_clicks_are_not_double_click(self, handler, monkeypatch):
+        """Test clicks further apart than the threshold stay single clicks."""
+        _fake_monotonic(monkeypatch, step_ms=handler.double_click_threshold + 1)
+
+        assert handler.handle_events(_left_click((60, 110)))[0] == Action.LEFT_CLICK
+        assert handler.handle_events(_left_click((60, 110)))[0] == Action.LEFT_CLICK
+
+    def test_click_clock_advances_without_pygame_init(self, handler):
+        """Test the click clock advances with no pygame subsystem initialized."""
+        handler.double_click_threshold = 0
+
+        handler.handle_events(_left_click((60, 110)))
+        time.sleep(0.002)
+
+        assert handler.handle_events(_left_click((60, 110)))[0] == Action.LEFT_CLICK
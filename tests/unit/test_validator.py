@@ -1,79 +1,58 @@
 """Unit tests for board validation logic."""
 
+import re
+
 import pytest
 from src.game.validator import (
     validate_board_settings,
     validate_position,
     get_adjacent_positions,
+    build_neighbor_cache,
     calculate_mine_density,
     suggest_reasonable_settings
 )
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_WIDTH_RE = re.compile(r"Width must be between 9 and 30")
+_HEIGHT_RE = re.compile(r"Height must be between 9 and 30")
+_MINE_COUNT_RE = re.compile(r"Mine count must be at least 1")
+_DENSITY_RE = re.compile(r"Mine density too high")
+_ROW_RE = re.compile(r"Row must be between 0 and")
+_COL_RE = re.compile(r"Column must be between 0 and")
+
 
 class TestValidateBoardSettings:
     """Test board settings validation."""
 
-    def test_valid_board_settings(self):
-        """Test valid board configurations."""
-        # Valid settings
-        assert validate_board_settings(9, 9, 10) is True
-        assert validate_board_settings(15, 15, 30) is True
-        assert validate_board_settings(20, 20, 50) is True
-        assert validate_board_settings(30, 30, 100) is True
-
-    def test_invalid_width_too_small(self):
-        """Test width too small."""
-        with pytest.raises(ValueError, match="Width must be between 9 and 30"):
-            validate_board_settings(8, 15, 10)
-
-    def test_invalid_width_too_large(self):
-        """Test width too large."""
-        with pytest.raises(ValueError, match="Width must be between 9 and 30"):
-            validate_board_settings(31, 15, 10)
-
-    def test_invalid_height_too_small(self):
-        """Test height too small."""
-        with pytest.raises(ValueError, match="Height must be between 9 and 30"):
-            validate_board_settings(15, 8, 10)
-
-    def test_invalid_height_too_large(self):
-        """Test height too large."""
-        with pytest.raises(ValueError, match="Height must be between 9 and 30"):
-            validate_board_settings(15, 31, 10)
-
-    def test_invalid_mine_count_zero(self):
-        """Test mine count zero."""
-        with pytest.raises(ValueError, match="Mine count must be at least 1"):
-            validate_board_settings(15, 15, 0)
-
-    def test_invalid_mine_count_too_high(self):
-        """Test mine count too high."""
-        with pytest.raises(ValueError, match="Width must be between 9 and 30"):
-            validate_board_settings(5, 5, 25)  # Invalid dimensions first
-
-    def test_invalid_mine_density_too_high(self):
-        """Test mine density too high."""
-        with pytest.raises(ValueError, match="Mine density too high"):
-            validate_board_settings(10, 10, 30)  # 30% density
-
-    def test_boundary_values(self):
-        """Test boundary values."""
-        # Minimum dimensions
-        assert validate_board_settings(9, 9, 1) is True
-
-        # Maximum dimensions
-        assert validate_board_settings(30, 30, 1) is True
-
-        # Maximum mine density (25%)
-        assert validate_board_settings(20, 20, 100) is True  # Exactly 25%
-
-    def test_non_integer_inputs(self):
-        """Test non-integer inputs."""
-        with pytest.raises(ValueError, match="Width must be between 9 and 30"):
-            validate_board_settings(15.5, 15, 10)
-
-        with pytest.raises(ValueError, match="Height must be between 9 and 30"):
-            validate_board_settings(15, 15.5, 10)
+    @pytest.mark.parametrize("width,height,mines", [
+        (9, 9, 10),
+        (15, 15, 30),
+        (20, 20, 50),
+        (30, 30, 100),
+        (9, 9, 1),      # Minimum dimensions
+        (30, 30, 1),    # Maximum dimensions
+        (20, 20, 100),  # Exactly 25% density
+    ])
+    def test_valid_board_settings(self, width, height, mines):
+        """Test valid and boundary board configurations."""
+        assert validate_board_settings(width, height, mines) is True
+
+    @pytest.mark.parametrize("width,height,mines,match", [
+        pytest.param(8, 15, 10, _WIDTH_RE, id="width_too_small"),
+        pytest.param(31, 15, 10, _WIDTH_RE, id="width_too_large"),
+        pytest.param(15, 8, 10, _HEIGHT_RE, id="height_too_small"),
+        pytest.param(15, 31, 10, _HEIGHT_RE, id="height_too_large"),
+        pytest.param(15, 15, 0, _MINE_COUNT_RE, id="mine_count_zero"),
+        # Invalid dimensions are reported before the mine count
+        pytest.param(5, 5, 25, _WIDTH_RE, id="mine_count_too_high"),
+        pytest.param(10, 10, 30, _DENSITY_RE, id="mine_density_too_high"),
+        pytest.param(15.5, 15, 10, _WIDTH_RE, id="non_integer_width"),
+        pytest.param(15, 15.5, 10, _HEIGHT_RE, id="non_integer_height"),
+    ])
+    def test_invalid_board_settings(self, width, height, mines, match):
+        """Test that invalid settings raise with the first failing rule."""
+        with pytest.raises(ValueError, match=match):
+            validate_board_settings(width, height, mines)
 
 
 class TestValidatePosition:
@@ -86,25 +65,16 @@ class TestValidatePosition:
         assert validate_position(9, 9, 10, 10) is True
         assert validate_position(29, 29, 30, 30) is True
 
-    def test_invalid_row_negative(self):
-        """Test negative row."""
-        with pytest.raises(ValueError, match="Row must be between 0 and"):
-            validate_position(-1, 5, 10, 10)
-
-    def test_invalid_row_too_high(self):
-        """Test row too high."""
-        with pytest.raises(ValueError, match="Row must be between 0 and"):
-            validate_position(10, 5, 10, 10)
-
-    def test_invalid_col_negative(self):
-        """Test negative column."""
-        with pytest.raises(ValueError, match="Column must be between 0 and"):
-            validate_position(5, -1, 10, 10)
-
-    def test_invalid_col_too_high(self):
-        """Test column too high."""
-        with pytest.raises(ValueError, match="Column must be between 0 and"):
-            validate_position(5, 10, 10, 10)
+    @pytest.mark.parametrize("row,col,match", [
+        pytest.param(-1, 5, _ROW_RE, id="row_negative"),
+        pytest.param(10, 5, _ROW_RE, id="row_too_high"),
+        pytest.param(5, -1, _COL_RE, id="col_negative"),
+        pytest.param(5, 10, _COL_RE, id="col_too_high"),
+    ])
+    def test_invalid_positions(self, row, col, match):
+        """Test out-of-bounds positions on a 10x10 board."""
+        with pytest.raises(ValueError, match=match):
+            validate_position(row, col, 10, 10)
 
     def test_boundary_positions(self):
         """Test boundary positions."""
@@ -116,30 +86,19 @@ class TestValidatePosition:
 class TestGetAdjacentPositions:
     """Test getting adjacent positions."""
 
-    def test_center_cell(self):
-        """Test adjacent positions for center cell."""
-        adjacent = get_adjacent_positions(1, 1, 3, 3)
-        expected = [
+    @pytest.mark.parametrize("row,col,expected", [
+        pytest.param(1, 1, [
             (0, 0), (0, 1), (0, 2),
             (1, 0),         (1, 2),
             (2, 0), (2, 1), (2, 2)
-        ]
-        assert len(adjacent) == 8
-        assert set(adjacent) == set(expected)
-
-    def test_corner_cell(self):
-        """Test adjacent positions for corner cell."""
-        adjacent = get_adjacent_positions(0, 0, 3, 3)
-        expected = [(0, 1), (1, 0), (1, 1)]
-        assert len(adjacent) == 3
-        assert set(adjacent) == set(expected)
-
-    def test_edge_cell(self):
-        """Test adjacent positions for edge cell."""
-        adjacent = get_adjacent_positions(0, 1, 3, 3)
-        expected = [(0, 0), (0, 2), (1, 0), (1, 1), (1, 2)]
-        assert len(adjacent) == 5
-        assert set(adjacent) == set(expected)
+        ], id="center_cell"),
+        pytest.param(0, 0, [(0, 1), (1, 0), (1, 1)], id="corner_cell"),
+        pytest.param(0, 1, [(0, 0), (0, 2), (1, 0), (1, 1), (1, 2)], id="edge_cell"),
+    ])
+    def test_adjacent_positions_on_3x3_board(self, row, col, expected):
+        """Test adjacent positions for center, corner and edge cells."""
+        adjacent = get_adjacent_positions(row, col, 3, 3)
+        assert sorted(adjacent) == sorted(expected)
 
     def test_single_cell_board(self):
         """Test adjacent positions for single cell board."""
@@ -157,54 +116,48 @@ class TestGetAdjacentPositions:
             assert 0 <= col < 10
 
 
-class TestCalculateMineDensity:
-    """Test mine density calculation."""
+class TestBuildNeighborCache:
+    """Test the flat neighbor index table."""
 
-    def test_calculate_mine_density(self):
-        """Test mine density calculation."""
-        # 10% density
-        density = calculate_mine_density(10, 10, 10)
-        assert density == 0.1
-
-        # 20% density
-        density = calculate_mine_density(10, 10, 20)
-        assert density == 0.2
+    def test_matches_adjacent_positions(self):
+        """Test that each entry matches get_adjacent_positions."""
+        width, height = 4, 3
+        cache = build_neighbor_cache(width, height)
+        assert len(cache) == width * height
 
-        # 25% density (maximum)
-        density = calculate_mine_density(20, 20, 100)
-        assert density == 0.25
+        for row in range(height):
+            for col in range(width):
+                expected = {r * width + c for r, c in get_adjacent_positions(row, col, width, height)}
+                assert set(cache[row * width + col]) == expected
 
-        # Very low density
-        density = calculate_mine_density(30, 30, 1)
-        assert density == 1 / 900
 
-    def test_zero_mines(self):
-        """Test zero mine density."""
-        density = calculate_mine_density(10, 10, 0)
-        assert density == 0.0
+class TestCalculateMineDensity:
+    """Test mine density calculation."""
 
-    def test_maximum_mines(self):
-        """Test maximum mine density."""
-        density = calculate_mine_density(10, 10, 99)  # 99% of cells
-        assert density == 0.99
+    @pytest.mark.parametrize("width,height,mines,expected", [
+        pytest.param(10, 10, 10, 0.1, id="10_percent"),
+        pytest.param(10, 10, 20, 0.2, id="20_percent"),
+        pytest.param(20, 20, 100, 0.25, id="maximum_playable"),
+        pytest.param(30, 30, 1, 1 / 900, id="very_low"),
+        pytest.param(10, 10, 0, 0.0, id="zero_mines"),
+        pytest.param(10, 10, 99, 0.99, id="maximum_mines"),
+    ])
+    def test_calculate_mine_density(self, width, height, mines, expected):
+        """Test mine density calculation."""
+        assert calculate_mine_density(width, height, mines) == expected
 
 
 class TestSuggestReasonableSettings:
     """Test reasonable settings suggestion."""
 
-    def test_suggest_reasonable_settings(self):
+    @pytest.mark.parametrize("width,height,expected", [
+        (10, 10, 15),   # 15% of 100
+        (20, 20, 60),   # 15% of 400
+        (30, 30, 135),  # 15% of 900
+    ])
+    def test_suggest_reasonable_settings(self, width, height, expected):
         """Test reasonable settings suggestion."""
-        # 10x10 board
-        mines = suggest_reasonable_settings(10, 10)
-        assert mines == 15  # 15% of 100
-
-        # 20x20 board
-        mines = suggest_reasonable_settings(20, 20)
-        assert mines == 60  # 15% of 400
-
-        # 30x30 board
-        mines = suggest_reasonable_settings(30, 30)
-        assert mines == 135  # 15% of 900
+        assert suggest_reasonable_settings(width, height) == expected
 
     def test_suggest_minimum_mines(self):
         """Test suggestion for very small boards."""